@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import voluptuous as vol
-from typing import Any, Dict, Optional
+from collections import ChainMap
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
 
 from homeassistant import config_entries
 from homeassistant.core import callback
@@ -64,23 +66,13 @@ from .const import (
     CONF_LOW_FLOW_AUTO_SHUTOFF,
     CONF_TANK_LEAK_AUTO_SHUTOFF,
     CONF_INTEL_AUTO_SHUTOFF,
+    # intelligent detection
+    CONF_INTEL_DETECT_ENABLE,
+    CONF_INTEL_LEARNING_ENABLE,
+    CONF_INTEL_SUPPRESS_NOTIFICATIONS_DURING_LEARNING,
+    CONF_INTEL_MINIMUM_LEARNING_DAYS,
 )
 
-# New intelligent detection constants were introduced recently; fall back to string keys
-# if running against an older const.py in a live HA instance.
-try:
-    from .const import (
-        CONF_INTEL_DETECT_ENABLE, 
-        CONF_INTEL_LEARNING_ENABLE,
-        CONF_INTEL_SUPPRESS_NOTIFICATIONS_DURING_LEARNING,
-        CONF_INTEL_MINIMUM_LEARNING_DAYS
-    )  # type: ignore
-except Exception:  # pragma: no cover - compatibility with older installs
-    CONF_INTEL_DETECT_ENABLE = "intelligent_leak_detection_enable"  # type: ignore
-    CONF_INTEL_LEARNING_ENABLE = "intelligent_learning_enable"  # type: ignore
-    CONF_INTEL_SUPPRESS_NOTIFICATIONS_DURING_LEARNING = "intel_suppress_during_learning"  # type: ignore
-    CONF_INTEL_MINIMUM_LEARNING_DAYS = "intel_minimum_learning_days"  # type: ignore
-
 # Try to use HA selectors; fall back to plain types if not available
 HAS_SELECTORS = True
 try:
@@ -90,332 +82,461 @@ except Exception:
     ha_selector = None  # type: ignore
 
 
-def s_entity(domain: str):
-    if HAS_SELECTORS:
-        return ha_selector({"entity": {"domain": domain}})
-    return str  # fallback: free text entity_id
+# Selector helpers are memoized so identical field types share one selector
+# instance across fields, schemas and renders. HAS_SELECTORS is fixed at import,
+# so pick the implementation once instead of branching on every call.
+if HAS_SELECTORS:
+    @lru_cache(maxsize=None)
+    def s_entity(domain: str | tuple[str, ...]):
+        return ha_selector({"entity": {"domain": list(domain) if isinstance(domain, tuple) else domain}})
 
+    @lru_cache(maxsize=None)
+    def s_number(min_: float | int = 0, step: float | int = 1, mode: str = "box"):
+        return ha_selector({"number": {"min": min_, "step": step, "mode": mode}})
 
-def s_number(min_: float | int = 0, step: float | int = 1, mode: str = "box"):
-    if HAS_SELECTORS:
+    @lru_cache(maxsize=None)
+    def s_int(min_: int = 0, step: int = 1, mode: str = "box"):
         return ha_selector({"number": {"min": min_, "step": step, "mode": mode}})
-    return vol.Coerce(float)
 
+    @lru_cache(maxsize=None)
+    def s_bool():
+        return ha_selector({"boolean": {}})
 
-def s_int(min_: int = 0, step: int = 1, mode: str = "box"):
-    if HAS_SELECTORS:
-        return ha_selector({"number": {"min": min_, "step": step, "mode": mode}})
-    return vol.Coerce(int)
+    @lru_cache(maxsize=None)
+    def s_select(options: tuple[str, ...]):
+        return ha_selector({"select": {"options": list(options)}})
 
+    @lru_cache(maxsize=None)
+    def s_text():
+        return ha_selector({"text": {}})
 
-def s_bool():
-    if HAS_SELECTORS:
-        return ha_selector({"boolean": {}})
-    return vol.Coerce(bool)
+else:
+    def s_entity(domain: str | tuple[str, ...]):
+        return str  # fallback: free text entity_id
 
+    @lru_cache(maxsize=None)
+    def s_number(min_: float | int = 0, step: float | int = 1, mode: str = "box"):
+        return vol.Coerce(float)
 
-def s_select(options: list[str]):
-    if HAS_SELECTORS:
-        return ha_selector({"select": {"options": options}})
-    return vol.In(options)
+    @lru_cache(maxsize=None)
+    def s_int(min_: int = 0, step: int = 1, mode: str = "box"):
+        return vol.Coerce(int)
 
+    @lru_cache(maxsize=None)
+    def s_bool():
+        return vol.Coerce(bool)
+
+    @lru_cache(maxsize=None)
+    def s_select(options: tuple[str, ...]):
+        return vol.In(options)
+
+    def s_text():
+        return str
 
-def s_text():
-    if HAS_SELECTORS:
-        return ha_selector({"text": {}})
-    return str
+
+_VALVE_DOMAINS = ("valve", "switch", "input_boolean")
+
+# Labeled select selectors never vary between renders; build them once at import
+if HAS_SELECTORS:
+    _INTEGRATION_METHOD_SELECTOR = ha_selector({
+        "select": {
+            "options": [
+                INTEGRATION_METHOD_TRAPEZOIDAL,
+                INTEGRATION_METHOD_LEFT
+            ],
+            "mode": "list",
+            "translation_key": "integration_method"
+        }
+    })
+    _LOW_FLOW_COUNTING_MODE_SELECTOR = ha_selector({
+        "select": {
+            "options": [
+                COUNTING_MODE_NONZERO,
+                COUNTING_MODE_IN_RANGE,
+                COUNTING_MODE_BASELINE_LATCH
+            ],
+            "mode": "list",
+            "translation_key": "low_flow_counting_mode"
+        }
+    })
+else:
+    _INTEGRATION_METHOD_SELECTOR = vol.In([INTEGRATION_METHOD_TRAPEZOIDAL, INTEGRATION_METHOD_LEFT])
+    _LOW_FLOW_COUNTING_MODE_SELECTOR = vol.In([COUNTING_MODE_NONZERO, COUNTING_MODE_IN_RANGE])
 
 
 def _clean_optional_seconds(value: Any) -> Optional[int]:
     """Convert possibly blank/None to int seconds or None."""
-    if value is None:
+    if value is None or value == "" or isinstance(value, bool):
         return None
-    if isinstance(value, (int, float)):
+    # Common case: selector already produced a number (or an integer string)
+    try:
         return int(value)
-    s = str(value).strip()
-    if s == "":
-        return None
+    except (ValueError, TypeError, OverflowError):
+        pass
+    # Text fallback such as "12.5"; float() tolerates surrounding whitespace
     try:
-        return int(float(s))
-    except (ValueError, TypeError):
+        return int(float(value))
+    except (ValueError, TypeError, OverflowError):
         return None
 
 
-def _main_schema(existing: Optional[Dict[str, Any]] = None) -> vol.Schema:
-    ex = existing or {}
-    fields: Dict[Any, Any] = {}
+# Free-text occupancy state lists normalized on submit
+_OCC_CSV_KEYS = (CONF_OCC_STATE_AWAY, CONF_OCC_STATE_VACATION)
+
+
+def _normalize_csv(value: str) -> str:
+    """Strip each comma-separated token and drop empties."""
+    return ", ".join(s for p in value.split(",") if (s := p.strip()))
+
+
+def _drop_if_falsy(data: Dict[str, Any], *keys: str) -> None:
+    """Remove keys whose submitted value is blank/falsy."""
+    for k in keys:
+        if k in data and not data[k]:
+            del data[k]
+
+
+# Markers are immutable once built; share one per (key, default). typed=True keeps
+# 0 / 0.0 / False defaults distinct so each field keeps its own default type.
+@lru_cache(maxsize=256, typed=True)
+def _req_cached(key: str, default: Any) -> vol.Required:
+    return vol.Required(key, default=default)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _opt_cached(key: str, default: Any) -> vol.Optional:
+    return vol.Optional(key, default=default)
 
-    fields[vol.Required(CONF_SENSOR_PREFIX, default=ex.get(CONF_SENSOR_PREFIX, DEFAULTS[CONF_SENSOR_PREFIX]))] = str
-    fields[vol.Required(CONF_FLOW_SENSOR, default=ex.get(CONF_FLOW_SENSOR, ""))] = s_entity("sensor")
+
+def _req(key: str, default: Any = vol.UNDEFINED) -> vol.Required:
+    try:
+        return _req_cached(key, default)
+    except TypeError:  # unhashable default
+        return vol.Required(key, default=default)
+
+
+def _opt(key: str, default: Any = vol.UNDEFINED) -> vol.Optional:
+    try:
+        return _opt_cached(key, default)
+    except TypeError:  # unhashable default
+        return vol.Optional(key, default=default)
+
+
+def _main_fields(ex: Dict[str, Any]) -> Iterator[Tuple[Any, Any]]:
+    # Bind hot lookups to locals once; every field below reads through them
+    d = DEFAULTS
+    get = ex.get
+    yield _req(CONF_SENSOR_PREFIX, default=get(CONF_SENSOR_PREFIX, d[CONF_SENSOR_PREFIX])), str
+    yield _req(CONF_FLOW_SENSOR, default=get(CONF_FLOW_SENSOR, "")), s_entity("sensor")
     # Optional volume sensor: if existing, include default; else present without default
-    existing_vol = ex.get(CONF_VOLUME_SENSOR, None)
+    existing_vol = get(CONF_VOLUME_SENSOR, None)
     if existing_vol in (None, ""):
-        fields[vol.Optional(CONF_VOLUME_SENSOR)] = s_entity("sensor")
+        yield _opt(CONF_VOLUME_SENSOR), s_entity("sensor")
     else:
-        fields[vol.Optional(CONF_VOLUME_SENSOR, default=existing_vol)] = s_entity("sensor")
+        yield _opt(CONF_VOLUME_SENSOR, default=existing_vol), s_entity("sensor")
         # Convenience: show clear toggle directly below the volume selector when applicable
-        fields[vol.Optional("clear_volume_sensor", default=False)] = s_bool()
+        yield _opt("clear_volume_sensor", default=False), s_bool()
 
     # Optional hot water sensor; include default if present so reconfigure shows prior value
-    existing_hot = ex.get(CONF_HOT_WATER_SENSOR, None)
+    existing_hot = get(CONF_HOT_WATER_SENSOR, None)
     if existing_hot in (None, ""):
-        fields[vol.Optional(CONF_HOT_WATER_SENSOR)] = s_entity("binary_sensor")
+        yield _opt(CONF_HOT_WATER_SENSOR), s_entity("binary_sensor")
     else:
-        fields[vol.Optional(CONF_HOT_WATER_SENSOR, default=existing_hot)] = s_entity("binary_sensor")
+        yield _opt(CONF_HOT_WATER_SENSOR, default=existing_hot), s_entity("binary_sensor")
         # Convenience: show clear toggle directly below the hot water selector when applicable
-        fields[vol.Optional("clear_hot_water_sensor", default=False)] = s_bool()
+        yield _opt("clear_hot_water_sensor", default=False), s_bool()
 
     # Optional water shutoff valve (valve | switch | input_boolean)
-    existing_valve = ex.get(CONF_WATER_SHUTOFF_ENTITY, None)
+    existing_valve = get(CONF_WATER_SHUTOFF_ENTITY, None)
     if existing_valve in (None, ""):
         # Allow any of the supported domains
-        if HAS_SELECTORS:
-            fields[vol.Optional(CONF_WATER_SHUTOFF_ENTITY)] = ha_selector({
-                "entity": {"domain": ["valve", "switch", "input_boolean"]}
-            })
-        else:
-            fields[vol.Optional(CONF_WATER_SHUTOFF_ENTITY)] = str
+        yield _opt(CONF_WATER_SHUTOFF_ENTITY), s_entity(_VALVE_DOMAINS)
     else:
-        if HAS_SELECTORS:
-            fields[vol.Optional(CONF_WATER_SHUTOFF_ENTITY, default=existing_valve)] = ha_selector({
-                "entity": {"domain": ["valve", "switch", "input_boolean"]}
-            })
-        else:
-            fields[vol.Optional(CONF_WATER_SHUTOFF_ENTITY, default=existing_valve)] = str
-        fields[vol.Optional(CONF_CLEAR_WATER_SHUTOFF, default=False)] = s_bool()
-
-    fields[vol.Required(CONF_MIN_SESSION_VOLUME, default=ex.get(CONF_MIN_SESSION_VOLUME, DEFAULTS[CONF_MIN_SESSION_VOLUME]))] = s_number(
+        yield _opt(CONF_WATER_SHUTOFF_ENTITY, default=existing_valve), s_entity(_VALVE_DOMAINS)
+        yield _opt(CONF_CLEAR_WATER_SHUTOFF, default=False), s_bool()
+
+    yield _req(CONF_MIN_SESSION_VOLUME, default=get(CONF_MIN_SESSION_VOLUME, d[CONF_MIN_SESSION_VOLUME])), s_number(
         min_=0, step=0.01
     )
-    fields[vol.Required(CONF_MIN_SESSION_DURATION, default=ex.get(CONF_MIN_SESSION_DURATION, DEFAULTS[CONF_MIN_SESSION_DURATION]))] = s_int(
+    yield _req(CONF_MIN_SESSION_DURATION, default=get(CONF_MIN_SESSION_DURATION, d[CONF_MIN_SESSION_DURATION])), s_int(
         min_=0, step=1
     )
-    fields[vol.Required(CONF_SESSION_GAP_TOLERANCE, default=ex.get(CONF_SESSION_GAP_TOLERANCE, DEFAULTS[CONF_SESSION_GAP_TOLERANCE]))] = s_int(
+    yield _req(CONF_SESSION_GAP_TOLERANCE, default=get(CONF_SESSION_GAP_TOLERANCE, d[CONF_SESSION_GAP_TOLERANCE])), s_int(
         min_=0, step=1
     )
     # Continuity window removed; single-knob gap tolerance now governs finalization
     # Session boundary behavior
-    fields[vol.Required(CONF_SESSIONS_USE_BASELINE_AS_ZERO, default=ex.get(CONF_SESSIONS_USE_BASELINE_AS_ZERO, DEFAULTS[CONF_SESSIONS_USE_BASELINE_AS_ZERO]))] = s_bool()
-    fields[vol.Required(CONF_SESSIONS_IDLE_TO_CLOSE_S, default=ex.get(CONF_SESSIONS_IDLE_TO_CLOSE_S, DEFAULTS[CONF_SESSIONS_IDLE_TO_CLOSE_S]))] = s_int(min_=0, step=1)
+    yield _req(CONF_SESSIONS_USE_BASELINE_AS_ZERO, default=get(CONF_SESSIONS_USE_BASELINE_AS_ZERO, d[CONF_SESSIONS_USE_BASELINE_AS_ZERO])), s_bool()
+    yield _req(CONF_SESSIONS_IDLE_TO_CLOSE_S, default=get(CONF_SESSIONS_IDLE_TO_CLOSE_S, d[CONF_SESSIONS_IDLE_TO_CLOSE_S])), s_int(min_=0, step=1)
 
     # Volume calculation from flow is automatic: enabled when no volume sensor is configured.
     # No explicit toggle is shown in the UI to avoid confusion.
     # Integration method selection (advanced): only relevant when no volume sensor is configured.
     # Place at the bottom; label clarified via translations.
-    existing_vol = ex.get(CONF_VOLUME_SENSOR, None)
+    existing_vol = get(CONF_VOLUME_SENSOR, None)
     if not existing_vol:
-        if HAS_SELECTORS:
-            fields[vol.Required(
-                CONF_INTEGRATION_METHOD,
-                default=ex.get(CONF_INTEGRATION_METHOD, DEFAULTS[CONF_INTEGRATION_METHOD])
-            )] = ha_selector({
-                "select": {
-                    "options": [
-                        INTEGRATION_METHOD_TRAPEZOIDAL,
-                        INTEGRATION_METHOD_LEFT
-                    ],
-                    "mode": "list",
-                    "translation_key": "integration_method"
-                }
-            })
-        else:
-            fields[vol.Required(
-                CONF_INTEGRATION_METHOD,
-                default=ex.get(CONF_INTEGRATION_METHOD, DEFAULTS[CONF_INTEGRATION_METHOD])
-            )] = vol.In([INTEGRATION_METHOD_TRAPEZOIDAL, INTEGRATION_METHOD_LEFT])
+        yield _req(
+            CONF_INTEGRATION_METHOD,
+            default=get(CONF_INTEGRATION_METHOD, d[CONF_INTEGRATION_METHOD])
+        ), _INTEGRATION_METHOD_SELECTOR
 
     # Toggles order: low-flow -> tank refill -> intelligent -> synthetic
-    fields[vol.Required(CONF_LOW_FLOW_ENABLE, default=ex.get(CONF_LOW_FLOW_ENABLE, DEFAULTS[CONF_LOW_FLOW_ENABLE]))] = s_bool()
-    fields[vol.Required(CONF_TANK_LEAK_ENABLE, default=ex.get(CONF_TANK_LEAK_ENABLE, DEFAULTS[CONF_TANK_LEAK_ENABLE]))] = s_bool()
-    fields[vol.Required(
+    yield _req(CONF_LOW_FLOW_ENABLE, default=get(CONF_LOW_FLOW_ENABLE, d[CONF_LOW_FLOW_ENABLE])), s_bool()
+    yield _req(CONF_TANK_LEAK_ENABLE, default=get(CONF_TANK_LEAK_ENABLE, d[CONF_TANK_LEAK_ENABLE])), s_bool()
+    yield _req(
         CONF_INTEL_DETECT_ENABLE,
-        default=ex.get(CONF_INTEL_DETECT_ENABLE, DEFAULTS.get(CONF_INTEL_DETECT_ENABLE, False)),
-    )] = s_bool()
-    fields[vol.Required(
+        default=get(CONF_INTEL_DETECT_ENABLE, d[CONF_INTEL_DETECT_ENABLE]),
+    ), s_bool()
+    yield _req(
         CONF_SYNTHETIC_ENABLE,
-        default=ex.get(CONF_SYNTHETIC_ENABLE, DEFAULTS.get(CONF_SYNTHETIC_ENABLE, False)),
-    )] = s_bool()
+        default=get(CONF_SYNTHETIC_ENABLE, d[CONF_SYNTHETIC_ENABLE]),
+    ), s_bool()
 
-    return vol.Schema(fields)
 
+def _build_main_schema(ex: Dict[str, Any]) -> vol.Schema:
+    return vol.Schema(dict(_main_fields(ex)))
 
-def _low_flow_schema(existing: Optional[Dict[str, Any]] = None) -> vol.Schema:
-    ex = existing or {}
-    fields: Dict[Any, Any] = {}
 
-    fields[vol.Required(CONF_LOW_FLOW_MAX_FLOW, default=ex.get(CONF_LOW_FLOW_MAX_FLOW, DEFAULTS[CONF_LOW_FLOW_MAX_FLOW]))] = s_number(
+def _low_flow_fields(ex: Dict[str, Any]) -> Iterator[Tuple[Any, Any]]:
+    d = DEFAULTS
+    get = ex.get
+    yield _req(CONF_LOW_FLOW_MAX_FLOW, default=get(CONF_LOW_FLOW_MAX_FLOW, d[CONF_LOW_FLOW_MAX_FLOW])), s_number(
         min_=0.01, step=0.01
     )
-    fields[vol.Required(CONF_LOW_FLOW_SEED_S, default=ex.get(CONF_LOW_FLOW_SEED_S, DEFAULTS[CONF_LOW_FLOW_SEED_S]))] = s_int(
+    yield _req(CONF_LOW_FLOW_SEED_S, default=get(CONF_LOW_FLOW_SEED_S, d[CONF_LOW_FLOW_SEED_S])), s_int(
         min_=0, step=1
     )
-    fields[vol.Required(CONF_LOW_FLOW_MIN_S, default=ex.get(CONF_LOW_FLOW_MIN_S, DEFAULTS[CONF_LOW_FLOW_MIN_S]))] = s_int(
+    yield _req(CONF_LOW_FLOW_MIN_S, default=get(CONF_LOW_FLOW_MIN_S, d[CONF_LOW_FLOW_MIN_S])), s_int(
         min_=1, step=1
     )
-    fields[vol.Required(CONF_LOW_FLOW_CLEAR_IDLE_S, default=ex.get(CONF_LOW_FLOW_CLEAR_IDLE_S, DEFAULTS[CONF_LOW_FLOW_CLEAR_IDLE_S]))] = s_int(
+    yield _req(CONF_LOW_FLOW_CLEAR_IDLE_S, default=get(CONF_LOW_FLOW_CLEAR_IDLE_S, d[CONF_LOW_FLOW_CLEAR_IDLE_S])), s_int(
         min_=1, step=1
     )
 
     # Counting mode: safe, labeled options
-    if HAS_SELECTORS:
-        fields[vol.Required(
-            CONF_LOW_FLOW_COUNTING_MODE,
-            default=ex.get(CONF_LOW_FLOW_COUNTING_MODE, DEFAULTS[CONF_LOW_FLOW_COUNTING_MODE])
-        )] = ha_selector({
-            "select": {
-                "options": [
-                    COUNTING_MODE_NONZERO,
-                    COUNTING_MODE_IN_RANGE,
-                    COUNTING_MODE_BASELINE_LATCH
-                ],
-                "mode": "list",
-                "translation_key": "low_flow_counting_mode"
-            }
-        })
-    else:
-        fields[vol.Required(
-            CONF_LOW_FLOW_COUNTING_MODE,
-            default=ex.get(CONF_LOW_FLOW_COUNTING_MODE, DEFAULTS[CONF_LOW_FLOW_COUNTING_MODE])
-        )] = vol.In([COUNTING_MODE_NONZERO, COUNTING_MODE_IN_RANGE])
+    yield _req(
+        CONF_LOW_FLOW_COUNTING_MODE,
+        default=get(CONF_LOW_FLOW_COUNTING_MODE, d[CONF_LOW_FLOW_COUNTING_MODE])
+    ), _LOW_FLOW_COUNTING_MODE_SELECTOR
 
-    fields[vol.Required(CONF_LOW_FLOW_SMOOTHING_S, default=ex.get(CONF_LOW_FLOW_SMOOTHING_S, DEFAULTS[CONF_LOW_FLOW_SMOOTHING_S]))] = s_int(
+    yield _req(CONF_LOW_FLOW_SMOOTHING_S, default=get(CONF_LOW_FLOW_SMOOTHING_S, d[CONF_LOW_FLOW_SMOOTHING_S])), s_int(
         min_=0, step=1
     )
-    fields[vol.Required(CONF_LOW_FLOW_BASELINE_MARGIN_PCT, default=ex.get(CONF_LOW_FLOW_BASELINE_MARGIN_PCT, DEFAULTS[CONF_LOW_FLOW_BASELINE_MARGIN_PCT]))] = s_number(min_=0, step=0.5)
-    fields[vol.Required(CONF_LOW_FLOW_COOLDOWN_S, default=ex.get(CONF_LOW_FLOW_COOLDOWN_S, DEFAULTS[CONF_LOW_FLOW_COOLDOWN_S]))] = s_int(
+    yield _req(CONF_LOW_FLOW_BASELINE_MARGIN_PCT, default=get(CONF_LOW_FLOW_BASELINE_MARGIN_PCT, d[CONF_LOW_FLOW_BASELINE_MARGIN_PCT])), s_number(min_=0, step=0.5)
+    yield _req(CONF_LOW_FLOW_COOLDOWN_S, default=get(CONF_LOW_FLOW_COOLDOWN_S, d[CONF_LOW_FLOW_COOLDOWN_S])), s_int(
         min_=0, step=1
     )
 
-    existing_clear = ex.get(CONF_LOW_FLOW_CLEAR_ON_HIGH_S, None)
+    existing_clear = get(CONF_LOW_FLOW_CLEAR_ON_HIGH_S, None)
     if existing_clear in (None, ""):
-        key = vol.Optional(CONF_LOW_FLOW_CLEAR_ON_HIGH_S)
+        key = _opt(CONF_LOW_FLOW_CLEAR_ON_HIGH_S)
     else:
-        key = vol.Optional(CONF_LOW_FLOW_CLEAR_ON_HIGH_S, default=str(existing_clear))
-    fields[key] = s_text()
+        key = _opt(CONF_LOW_FLOW_CLEAR_ON_HIGH_S, default=str(existing_clear))
+    yield key, s_text()
 
     # Auto-shutoff toggle (only meaningful when valve is configured)
-    valve_set = bool(ex.get(CONF_WATER_SHUTOFF_ENTITY))
+    valve_set = bool(get(CONF_WATER_SHUTOFF_ENTITY))
     if valve_set:
-        fields[vol.Required(
+        yield _req(
             CONF_LOW_FLOW_AUTO_SHUTOFF,
-            default=ex.get(CONF_LOW_FLOW_AUTO_SHUTOFF, DEFAULTS.get(CONF_LOW_FLOW_AUTO_SHUTOFF, False))
-        )] = s_bool()
+            default=get(CONF_LOW_FLOW_AUTO_SHUTOFF, d[CONF_LOW_FLOW_AUTO_SHUTOFF])
+        ), s_bool()
 
-    return vol.Schema(fields)
 
+def _build_low_flow_schema(ex: Dict[str, Any]) -> vol.Schema:
+    return vol.Schema(dict(_low_flow_fields(ex)))
 
-def _tank_leak_schema(existing: Optional[Dict[str, Any]] = None) -> vol.Schema:
-    ex = existing or {}
-    fields: Dict[Any, Any] = {}
 
-    fields[vol.Required(
+def _tank_leak_fields(ex: Dict[str, Any]) -> Iterator[Tuple[Any, Any]]:
+    d = DEFAULTS
+    get = ex.get
+    yield _req(
         CONF_TANK_LEAK_MIN_REFILL_VOLUME,
-        default=ex.get(CONF_TANK_LEAK_MIN_REFILL_VOLUME, DEFAULTS[CONF_TANK_LEAK_MIN_REFILL_VOLUME])
-    )] = s_number(min_=0.01, step=0.01)
+        default=get(CONF_TANK_LEAK_MIN_REFILL_VOLUME, d[CONF_TANK_LEAK_MIN_REFILL_VOLUME])
+    ), s_number(min_=0.01, step=0.01)
 
-    fields[vol.Required(
+    yield _req(
         CONF_TANK_LEAK_MAX_REFILL_VOLUME,
-        default=ex.get(CONF_TANK_LEAK_MAX_REFILL_VOLUME, DEFAULTS[CONF_TANK_LEAK_MAX_REFILL_VOLUME])
-    )] = s_number(min_=0, step=0.01)
+        default=get(CONF_TANK_LEAK_MAX_REFILL_VOLUME, d[CONF_TANK_LEAK_MAX_REFILL_VOLUME])
+    ), s_number(min_=0, step=0.01)
 
-    fields[vol.Required(
+    yield _req(
         CONF_TANK_LEAK_TOLERANCE_PCT,
-        default=ex.get(CONF_TANK_LEAK_TOLERANCE_PCT, DEFAULTS[CONF_TANK_LEAK_TOLERANCE_PCT])
-    )] = s_number(min_=1, step=1)
+        default=get(CONF_TANK_LEAK_TOLERANCE_PCT, d[CONF_TANK_LEAK_TOLERANCE_PCT])
+    ), s_number(min_=1, step=1)
 
-    fields[vol.Required(
+    yield _req(
         CONF_TANK_LEAK_REPEAT_COUNT,
-        default=ex.get(CONF_TANK_LEAK_REPEAT_COUNT, DEFAULTS[CONF_TANK_LEAK_REPEAT_COUNT])
-    )] = s_int(min_=2, step=1)
+        default=get(CONF_TANK_LEAK_REPEAT_COUNT, d[CONF_TANK_LEAK_REPEAT_COUNT])
+    ), s_int(min_=2, step=1)
 
-    fields[vol.Required(
+    yield _req(
         CONF_TANK_LEAK_MAX_HOT_WATER_PCT,
-        default=ex.get(CONF_TANK_LEAK_MAX_HOT_WATER_PCT, DEFAULTS[CONF_TANK_LEAK_MAX_HOT_WATER_PCT])
-    )] = s_number(min_=0, step=5)
+        default=get(CONF_TANK_LEAK_MAX_HOT_WATER_PCT, d[CONF_TANK_LEAK_MAX_HOT_WATER_PCT])
+    ), s_number(min_=0, step=5)
 
-    fields[vol.Required(
+    yield _req(
         CONF_TANK_LEAK_WINDOW_S,
-        default=ex.get(CONF_TANK_LEAK_WINDOW_S, DEFAULTS[CONF_TANK_LEAK_WINDOW_S])
-    )] = s_int(min_=60, step=60)
+        default=get(CONF_TANK_LEAK_WINDOW_S, d[CONF_TANK_LEAK_WINDOW_S])
+    ), s_int(min_=60, step=60)
 
-    fields[vol.Required(
+    yield _req(
         CONF_TANK_LEAK_CLEAR_IDLE_S,
-        default=ex.get(CONF_TANK_LEAK_CLEAR_IDLE_S, DEFAULTS[CONF_TANK_LEAK_CLEAR_IDLE_S])
-    )] = s_int(min_=60, step=60)
+        default=get(CONF_TANK_LEAK_CLEAR_IDLE_S, d[CONF_TANK_LEAK_CLEAR_IDLE_S])
+    ), s_int(min_=60, step=60)
 
-    fields[vol.Required(
+    yield _req(
         CONF_TANK_LEAK_COOLDOWN_S,
-        default=ex.get(CONF_TANK_LEAK_COOLDOWN_S, DEFAULTS[CONF_TANK_LEAK_COOLDOWN_S])
-    )] = s_int(min_=0, step=60)
+        default=get(CONF_TANK_LEAK_COOLDOWN_S, d[CONF_TANK_LEAK_COOLDOWN_S])
+    ), s_int(min_=0, step=60)
 
-    fields[vol.Required(
+    yield _req(
         CONF_TANK_LEAK_MIN_REFILL_DURATION_S,
-        default=ex.get(CONF_TANK_LEAK_MIN_REFILL_DURATION_S, DEFAULTS[CONF_TANK_LEAK_MIN_REFILL_DURATION_S])
-    )] = s_int(min_=0, step=1)
-    fields[vol.Required(
+        default=get(CONF_TANK_LEAK_MIN_REFILL_DURATION_S, d[CONF_TANK_LEAK_MIN_REFILL_DURATION_S])
+    ), s_int(min_=0, step=1)
+    yield _req(
         CONF_TANK_LEAK_MAX_REFILL_DURATION_S,
-        default=ex.get(CONF_TANK_LEAK_MAX_REFILL_DURATION_S, DEFAULTS[CONF_TANK_LEAK_MAX_REFILL_DURATION_S])
-    )] = s_int(min_=0, step=1)
+        default=get(CONF_TANK_LEAK_MAX_REFILL_DURATION_S, d[CONF_TANK_LEAK_MAX_REFILL_DURATION_S])
+    ), s_int(min_=0, step=1)
 
     # Auto-shutoff toggle (only meaningful when valve is configured)
-    valve_set = bool(ex.get(CONF_WATER_SHUTOFF_ENTITY))
+    valve_set = bool(get(CONF_WATER_SHUTOFF_ENTITY))
     if valve_set:
-        fields[vol.Required(
+        yield _req(
             CONF_TANK_LEAK_AUTO_SHUTOFF,
-            default=ex.get(CONF_TANK_LEAK_AUTO_SHUTOFF, DEFAULTS.get(CONF_TANK_LEAK_AUTO_SHUTOFF, False))
-        )] = s_bool()
+            default=get(CONF_TANK_LEAK_AUTO_SHUTOFF, d[CONF_TANK_LEAK_AUTO_SHUTOFF])
+        ), s_bool()
 
-    return vol.Schema(fields)
 
+def _build_tank_leak_schema(ex: Dict[str, Any]) -> vol.Schema:
+    return vol.Schema(dict(_tank_leak_fields(ex)))
 
-def _intelligent_schema(existing: Optional[Dict[str, Any]] = None) -> vol.Schema:
-    ex = existing or {}
-    fields: Dict[Any, Any] = {}
 
+def _intelligent_fields(ex: Dict[str, Any]) -> Iterator[Tuple[Any, Any]]:
+    d = DEFAULTS
+    get = ex.get
     # Optional occupancy mode entity (input_select preferred)
-    existing_occ = ex.get(CONF_OCC_MODE_ENTITY, None)
+    existing_occ = get(CONF_OCC_MODE_ENTITY, None)
     if existing_occ in (None, ""):
-        fields[vol.Optional(CONF_OCC_MODE_ENTITY)] = s_entity("input_select")
+        yield _opt(CONF_OCC_MODE_ENTITY), s_entity("input_select")
     else:
-        fields[vol.Optional(CONF_OCC_MODE_ENTITY, default=existing_occ)] = s_entity("input_select")
+        yield _opt(CONF_OCC_MODE_ENTITY, default=existing_occ), s_entity("input_select")
 
     # Optional CSV state lists
-    away_default = ex.get(CONF_OCC_STATE_AWAY, DEFAULTS.get(CONF_OCC_STATE_AWAY, ""))
-    vac_default = ex.get(CONF_OCC_STATE_VACATION, DEFAULTS.get(CONF_OCC_STATE_VACATION, ""))
+    away_default = get(CONF_OCC_STATE_AWAY, d[CONF_OCC_STATE_AWAY])
+    vac_default = get(CONF_OCC_STATE_VACATION, d[CONF_OCC_STATE_VACATION])
     if away_default:
-        fields[vol.Optional(CONF_OCC_STATE_AWAY, default=away_default)] = s_text()
+        yield _opt(CONF_OCC_STATE_AWAY, default=away_default), s_text()
     else:
-        fields[vol.Optional(CONF_OCC_STATE_AWAY)] = s_text()
+        yield _opt(CONF_OCC_STATE_AWAY), s_text()
     if vac_default:
-        fields[vol.Optional(CONF_OCC_STATE_VACATION, default=vac_default)] = s_text()
+        yield _opt(CONF_OCC_STATE_VACATION, default=vac_default), s_text()
     else:
-        fields[vol.Optional(CONF_OCC_STATE_VACATION)] = s_text()
+        yield _opt(CONF_OCC_STATE_VACATION), s_text()
 
-    fields[vol.Required(
+    yield _req(
         CONF_INTEL_LEARNING_ENABLE,
-    default=ex.get(CONF_INTEL_LEARNING_ENABLE, DEFAULTS.get(CONF_INTEL_LEARNING_ENABLE, True))
-    )] = s_bool()
+    default=get(CONF_INTEL_LEARNING_ENABLE, d[CONF_INTEL_LEARNING_ENABLE])
+    ), s_bool()
 
     # Notification control fields
-    fields[vol.Required(
+    yield _req(
         CONF_INTEL_SUPPRESS_NOTIFICATIONS_DURING_LEARNING,
-        default=ex.get(CONF_INTEL_SUPPRESS_NOTIFICATIONS_DURING_LEARNING, DEFAULTS.get(CONF_INTEL_SUPPRESS_NOTIFICATIONS_DURING_LEARNING, True))
-    )] = s_bool()
+        default=get(CONF_INTEL_SUPPRESS_NOTIFICATIONS_DURING_LEARNING, d[CONF_INTEL_SUPPRESS_NOTIFICATIONS_DURING_LEARNING])
+    ), s_bool()
     
-    fields[vol.Required(
+    yield _req(
         CONF_INTEL_MINIMUM_LEARNING_DAYS,
-        default=ex.get(CONF_INTEL_MINIMUM_LEARNING_DAYS, DEFAULTS.get(CONF_INTEL_MINIMUM_LEARNING_DAYS, 14))
-    )] = s_int(min_=1, step=1)
+        default=get(CONF_INTEL_MINIMUM_LEARNING_DAYS, d[CONF_INTEL_MINIMUM_LEARNING_DAYS])
+    ), s_int(min_=1, step=1)
 
     # Auto-shutoff toggle (only meaningful when valve is configured)
-    valve_set = bool(ex.get(CONF_WATER_SHUTOFF_ENTITY))
+    valve_set = bool(get(CONF_WATER_SHUTOFF_ENTITY))
     if valve_set:
-        fields[vol.Required(
+        yield _req(
             CONF_INTEL_AUTO_SHUTOFF,
-            default=ex.get(CONF_INTEL_AUTO_SHUTOFF, DEFAULTS.get(CONF_INTEL_AUTO_SHUTOFF, False))
-        )] = s_bool()
+            default=get(CONF_INTEL_AUTO_SHUTOFF, d[CONF_INTEL_AUTO_SHUTOFF])
+        ), s_bool()
+
+
+def _build_intelligent_schema(ex: Dict[str, Any]) -> vol.Schema:
+    return vol.Schema(dict(_intelligent_fields(ex)))
+
+
+# Built schemas are memoized by the (hashable) defaults they were rendered from;
+# re-opening a flow with unchanged settings reuses the previous vol.Schema.
+# vol.Schema compiles its validators eagerly in __init__, so the cached object
+# already carries the compiled validator; no warm-up call is needed.
+def _freeze(existing: Optional[Dict[str, Any]]) -> Optional[frozenset]:
+    """Hashable cache key for a defaults dict, or None if any value is unhashable.
+
+    Each value is keyed with its type so equal-but-distinct defaults (True/1,
+    5/5.0) do not share a schema rendered with the other type's default.
+    """
+    items = []
+    for k, v in (existing or {}).items():
+        try:
+            hash(v)
+        except TypeError:
+            return None
+        items.append((k, type(v), v))
+    return frozenset(items)
+
+
+def _thaw(items: frozenset) -> Dict[str, Any]:
+    return {k: v for k, _t, v in items}
+
+
+def _cached_schema(cached, build, existing: Optional[Dict[str, Any]]) -> vol.Schema:
+    frozen = _freeze(existing)
+    if frozen is None:
+        # Unhashable defaults (e.g. lists) are rendered fresh rather than cached
+        return build(dict(existing or {}))
+    return cached(frozen)
+
+
+@lru_cache(maxsize=32)
+def _main_schema_cached(items: frozenset) -> vol.Schema:
+    return _build_main_schema(_thaw(items))
+
+
+def _main_schema(existing: Optional[Dict[str, Any]] = None) -> vol.Schema:
+    if not existing:
+        return _MAIN_SCHEMA_DEFAULT
+    return _cached_schema(_main_schema_cached, _build_main_schema, existing)
+
+
+@lru_cache(maxsize=32)
+def _low_flow_schema_cached(items: frozenset) -> vol.Schema:
+    return _build_low_flow_schema(_thaw(items))
+
+
+def _low_flow_schema(existing: Optional[Dict[str, Any]] = None) -> vol.Schema:
+    return _cached_schema(_low_flow_schema_cached, _build_low_flow_schema, existing)
+
+
+@lru_cache(maxsize=32)
+def _tank_leak_schema_cached(items: frozenset) -> vol.Schema:
+    return _build_tank_leak_schema(_thaw(items))
+
+
+def _tank_leak_schema(existing: Optional[Dict[str, Any]] = None) -> vol.Schema:
+    return _cached_schema(_tank_leak_schema_cached, _build_tank_leak_schema, existing)
+
+
+@lru_cache(maxsize=32)
+def _intelligent_schema_cached(items: frozenset) -> vol.Schema:
+    return _build_intelligent_schema(_thaw(items))
+
+
+def _intelligent_schema(existing: Optional[Dict[str, Any]] = None) -> vol.Schema:
+    return _cached_schema(_intelligent_schema_cached, _build_intelligent_schema, existing)
+
 
-    return vol.Schema(fields)
+# The DEFAULTS-only main schema is built once at import so the first step of a
+# new flow skips schema construction entirely. Detector steps are opt-in (off by
+# default), so their schemas are only built, then memoized, when first shown.
+_MAIN_SCHEMA_DEFAULT = _build_main_schema({})
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -452,8 +573,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if user_input.get("clear_volume_sensor"):
                 user_input[CONF_VOLUME_SENSOR] = ""
             # Sanitize optional occupancy mode entity
-            if CONF_OCC_MODE_ENTITY in user_input and not user_input[CONF_OCC_MODE_ENTITY]:
-                user_input.pop(CONF_OCC_MODE_ENTITY, None)
+            _drop_if_falsy(user_input, CONF_OCC_MODE_ENTITY)
             # Remove helper toggles from payload prior to storing
             user_input.pop("clear_volume_sensor", None)
             user_input.pop("clear_hot_water_sensor", None)
@@ -472,18 +592,19 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 user_input[CONF_CALC_VOLUME_FROM_FLOW] = True
 
             self._data.update(user_input)
-            self._low_flow_enabled = bool(user_input.get(CONF_LOW_FLOW_ENABLE, False))
-            self._tank_leak_enabled = bool(user_input.get(CONF_TANK_LEAK_ENABLE, False))
-            self._intel_enabled = bool(user_input.get(CONF_INTEL_DETECT_ENABLE, False))
-            self._synthetic_enabled = bool(user_input.get(CONF_SYNTHETIC_ENABLE, False))
+            # Selector output is already bool; read each toggle once
+            self._low_flow_enabled = low_flow = user_input.get(CONF_LOW_FLOW_ENABLE, False)
+            self._tank_leak_enabled = tank_leak = user_input.get(CONF_TANK_LEAK_ENABLE, False)
+            self._intel_enabled = intel = user_input.get(CONF_INTEL_DETECT_ENABLE, False)
+            self._synthetic_enabled = synthetic = user_input.get(CONF_SYNTHETIC_ENABLE, False)
             # Order: low-flow -> tank -> intelligent -> synthetic
-            if self._low_flow_enabled:
+            if low_flow:
                 return await self.async_step_low_flow()
-            if self._tank_leak_enabled:
+            if tank_leak:
                 return await self.async_step_tank_leak()
-            if self._intel_enabled:
+            if intel:
                 return await self.async_step_intelligent()
-            if self._synthetic_enabled:
+            if synthetic:
                 return await self.async_step_synthetic()
             return self.async_create_entry(title=self._data.get(CONF_SENSOR_PREFIX) or "Water Monitor", data=self._data)
         # Present empty defaults; if re-entry via Abort/Back, normalize blanks
@@ -525,11 +646,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_intelligent(self, user_input: Optional[Dict[str, Any]] = None):
         if user_input is not None:
             # optional occupancy entity and CSV text fields
-            if CONF_OCC_MODE_ENTITY in user_input and not user_input[CONF_OCC_MODE_ENTITY]:
-                user_input.pop(CONF_OCC_MODE_ENTITY, None)
-            for k in (CONF_OCC_STATE_AWAY, CONF_OCC_STATE_VACATION):
+            _drop_if_falsy(user_input, CONF_OCC_MODE_ENTITY)
+            for k in _OCC_CSV_KEYS:
                 if k in user_input and isinstance(user_input[k], str):
-                    norm = ", ".join([p.strip() for p in user_input[k].split(",") if p.strip()])
+                    norm = _normalize_csv(user_input[k])
                     if norm:
                         user_input[k] = norm
                     else:
@@ -542,13 +662,13 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def _synthetic_schema(self, existing: Optional[Dict[str, Any]] = None) -> vol.Schema:
         ex = existing or {}
         fields: Dict[Any, Any] = {}
-        fields[vol.Required(
+        fields[_req(
             CONF_INCLUDE_SYNTHETIC_IN_DETECTORS,
-            default=ex.get(CONF_INCLUDE_SYNTHETIC_IN_DETECTORS, DEFAULTS.get(CONF_INCLUDE_SYNTHETIC_IN_DETECTORS, False)),
+            default=ex.get(CONF_INCLUDE_SYNTHETIC_IN_DETECTORS, DEFAULTS[CONF_INCLUDE_SYNTHETIC_IN_DETECTORS]),
         )] = s_bool()
-        fields[vol.Required(
+        fields[_req(
             CONF_INCLUDE_SYNTHETIC_IN_DAILY,
-            default=ex.get(CONF_INCLUDE_SYNTHETIC_IN_DAILY, DEFAULTS.get(CONF_INCLUDE_SYNTHETIC_IN_DAILY, False)),
+            default=ex.get(CONF_INCLUDE_SYNTHETIC_IN_DAILY, DEFAULTS[CONF_INCLUDE_SYNTHETIC_IN_DAILY]),
         )] = s_bool()
         return vol.Schema(fields)
 
@@ -564,24 +684,99 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return WaterMonitorOptionsFlow(entry)
 
 
+# Keys rendered on each options step (iteration order matches the form)
+_MAIN_KEYS = (
+    CONF_SENSOR_PREFIX,
+    CONF_FLOW_SENSOR,
+    CONF_VOLUME_SENSOR,
+    CONF_HOT_WATER_SENSOR,
+    CONF_WATER_SHUTOFF_ENTITY,
+    CONF_MIN_SESSION_VOLUME,
+    CONF_MIN_SESSION_DURATION,
+    CONF_SESSION_GAP_TOLERANCE,
+    CONF_SESSIONS_USE_BASELINE_AS_ZERO,
+    CONF_SESSIONS_IDLE_TO_CLOSE_S,
+    # Volume integration method (advanced)
+    CONF_INTEGRATION_METHOD,
+    # Toggles displayed in this order
+    CONF_LOW_FLOW_ENABLE,
+    CONF_TANK_LEAK_ENABLE,
+    CONF_INTEL_DETECT_ENABLE,
+    CONF_SYNTHETIC_ENABLE,
+)
+
+_LOW_FLOW_KEYS = (
+    CONF_LOW_FLOW_MAX_FLOW,
+    CONF_LOW_FLOW_SEED_S,
+    CONF_LOW_FLOW_MIN_S,
+    CONF_LOW_FLOW_CLEAR_IDLE_S,
+    CONF_LOW_FLOW_COUNTING_MODE,
+    CONF_LOW_FLOW_SMOOTHING_S,
+    CONF_LOW_FLOW_BASELINE_MARGIN_PCT,
+    CONF_LOW_FLOW_COOLDOWN_S,
+    CONF_LOW_FLOW_CLEAR_ON_HIGH_S,
+    CONF_WATER_SHUTOFF_ENTITY,
+    CONF_LOW_FLOW_AUTO_SHUTOFF,
+)
+
+_TANK_LEAK_KEYS = (
+    CONF_TANK_LEAK_MIN_REFILL_VOLUME,
+    CONF_TANK_LEAK_MAX_REFILL_VOLUME,
+    CONF_TANK_LEAK_TOLERANCE_PCT,
+    CONF_TANK_LEAK_REPEAT_COUNT,
+    CONF_TANK_LEAK_MAX_HOT_WATER_PCT,
+    CONF_TANK_LEAK_WINDOW_S,
+    CONF_TANK_LEAK_CLEAR_IDLE_S,
+    CONF_TANK_LEAK_COOLDOWN_S,
+    CONF_TANK_LEAK_MIN_REFILL_DURATION_S,
+    CONF_TANK_LEAK_MAX_REFILL_DURATION_S,
+    CONF_WATER_SHUTOFF_ENTITY,
+    CONF_TANK_LEAK_AUTO_SHUTOFF,
+)
+
+_INTELLIGENT_KEYS = (
+    CONF_OCC_MODE_ENTITY,
+    CONF_OCC_STATE_AWAY,
+    CONF_OCC_STATE_VACATION,
+    CONF_INTEL_LEARNING_ENABLE,
+    CONF_INTEL_SUPPRESS_NOTIFICATIONS_DURING_LEARNING,
+    CONF_INTEL_MINIMUM_LEARNING_DAYS,
+    CONF_WATER_SHUTOFF_ENTITY,
+    CONF_INTEL_AUTO_SHUTOFF,
+)
+
+_SYNTHETIC_KEYS = (
+    CONF_INCLUDE_SYNTHETIC_IN_DETECTORS,
+    CONF_INCLUDE_SYNTHETIC_IN_DAILY,
+)
+
+
 class WaterMonitorOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         self._entry = config_entry
-        self._existing = {**config_entry.data, **config_entry.options}
+        # Effective settings: options over stored data over DEFAULTS, chained (no copy)
+        self._effective: Mapping[str, Any] = ChainMap(config_entry.options, config_entry.data, DEFAULTS)
         self._opts: Dict[str, Any] = {}
-        self._low_flow_enabled = bool(self._existing.get(CONF_LOW_FLOW_ENABLE, DEFAULTS[CONF_LOW_FLOW_ENABLE]))
-        self._tank_leak_enabled = bool(self._existing.get(CONF_TANK_LEAK_ENABLE, DEFAULTS[CONF_TANK_LEAK_ENABLE]))
-        self._intel_enabled = bool(
-            self._existing.get(CONF_INTEL_DETECT_ENABLE, DEFAULTS.get(CONF_INTEL_DETECT_ENABLE, False))
-        )
-        self._synthetic_enabled = bool(
-            self._existing.get(CONF_SYNTHETIC_ENABLE, DEFAULTS.get(CONF_SYNTHETIC_ENABLE, False))
-        )
+        self._low_flow_enabled = bool(self._effective.get(CONF_LOW_FLOW_ENABLE, False))
+        self._tank_leak_enabled = bool(self._effective.get(CONF_TANK_LEAK_ENABLE, False))
+        self._intel_enabled = bool(self._effective.get(CONF_INTEL_DETECT_ENABLE, False))
+        self._synthetic_enabled = bool(self._effective.get(CONF_SYNTHETIC_ENABLE, False))
 
     @callback
     def _store(self):
         return self.async_create_entry(title="", data=self._opts)
 
+    def _step_defaults(self, keys: Tuple[str, ...], overlay: bool = True) -> Optional[Dict[str, Any]]:
+        """Return form defaults for a step, or None when every value is still the DEFAULT.
+
+        With overlay=True, values already chosen on earlier steps (self._opts) win.
+        None lets the schema helpers serve their DEFAULTS-only schema directly.
+        """
+        src = ChainMap(self._opts, self._effective) if overlay else self._effective
+        if all(src.get(k) == DEFAULTS.get(k) for k in keys):
+            return None
+        return {k: src.get(k) for k in keys}
+
     async def async_step_init(self, user_input: Optional[Dict[str, Any]] = None):
         if user_input is not None:
             # Sanitize optional hot water: treat empty strings as absent
@@ -605,8 +800,7 @@ class WaterMonitorOptionsFlow(config_entries.OptionsFlow):
             if user_input.get("clear_volume_sensor"):
                 user_input[CONF_VOLUME_SENSOR] = ""
             # Sanitize optional occupancy mode entity
-            if CONF_OCC_MODE_ENTITY in user_input and not user_input[CONF_OCC_MODE_ENTITY]:
-                user_input.pop(CONF_OCC_MODE_ENTITY, None)
+            _drop_if_falsy(user_input, CONF_OCC_MODE_ENTITY)
             # Remove helper toggles from payload prior to storing
             user_input.pop("clear_volume_sensor", None)
             user_input.pop("clear_hot_water_sensor", None)
@@ -621,53 +815,34 @@ class WaterMonitorOptionsFlow(config_entries.OptionsFlow):
                 user_input[CONF_WATER_SHUTOFF_ENTITY] = ""
 
             self._opts.update(user_input)
-            self._low_flow_enabled = bool(user_input.get(CONF_LOW_FLOW_ENABLE, DEFAULTS[CONF_LOW_FLOW_ENABLE]))
-            self._tank_leak_enabled = bool(user_input.get(CONF_TANK_LEAK_ENABLE, DEFAULTS[CONF_TANK_LEAK_ENABLE]))
-            self._intel_enabled = bool(user_input.get(CONF_INTEL_DETECT_ENABLE, DEFAULTS.get(CONF_INTEL_DETECT_ENABLE, False)))
-            self._synthetic_enabled = bool(user_input.get(CONF_SYNTHETIC_ENABLE, DEFAULTS.get(CONF_SYNTHETIC_ENABLE, False)))
+            # Selector output is already bool; read each toggle once
+            self._low_flow_enabled = low_flow = user_input.get(CONF_LOW_FLOW_ENABLE, DEFAULTS[CONF_LOW_FLOW_ENABLE])
+            self._tank_leak_enabled = tank_leak = user_input.get(CONF_TANK_LEAK_ENABLE, DEFAULTS[CONF_TANK_LEAK_ENABLE])
+            self._intel_enabled = intel = user_input.get(CONF_INTEL_DETECT_ENABLE, DEFAULTS[CONF_INTEL_DETECT_ENABLE])
+            self._synthetic_enabled = synthetic = user_input.get(CONF_SYNTHETIC_ENABLE, DEFAULTS[CONF_SYNTHETIC_ENABLE])
             # If volume sensor omitted, prefer integration-from-flow
             if vol_missing or not user_input.get(CONF_VOLUME_SENSOR):
                 self._opts[CONF_CALC_VOLUME_FROM_FLOW] = True
             # Order: low-flow -> tank -> intelligent -> synthetic
-            if self._low_flow_enabled:
+            if low_flow:
                 return await self.async_step_low_flow()
-            if self._tank_leak_enabled:
+            if tank_leak:
                 return await self.async_step_tank_leak()
-            if self._intel_enabled:
+            if intel:
                 return await self.async_step_intelligent()
-            if self._synthetic_enabled:
+            if synthetic:
                 return await self.async_step_synthetic()
             return self._store()
 
-        defaults = {
-            k: self._existing.get(k, DEFAULTS.get(k))
-            for k in [
-                CONF_SENSOR_PREFIX,
-                CONF_FLOW_SENSOR,
-                CONF_VOLUME_SENSOR,
-                CONF_HOT_WATER_SENSOR,
-                CONF_WATER_SHUTOFF_ENTITY,
-                CONF_MIN_SESSION_VOLUME,
-                CONF_MIN_SESSION_DURATION,
-                CONF_SESSION_GAP_TOLERANCE,
-                CONF_SESSIONS_USE_BASELINE_AS_ZERO,
-                CONF_SESSIONS_IDLE_TO_CLOSE_S,
-                # Volume integration method (advanced)
-                CONF_INTEGRATION_METHOD,
-                # Toggles displayed in this order
-                CONF_LOW_FLOW_ENABLE,
-                CONF_TANK_LEAK_ENABLE,
-                CONF_INTEL_DETECT_ENABLE,
-                CONF_SYNTHETIC_ENABLE,
-            ]
-        }
-        # Normalize blanks for option selectors: show truly empty fields when stored as ""
-        if isinstance(defaults.get(CONF_VOLUME_SENSOR), str) and defaults.get(CONF_VOLUME_SENSOR) == "":
-            defaults[CONF_VOLUME_SENSOR] = None
-        if isinstance(defaults.get(CONF_HOT_WATER_SENSOR), str) and defaults.get(CONF_HOT_WATER_SENSOR) == "":
-            defaults[CONF_HOT_WATER_SENSOR] = None
-        if isinstance(defaults.get(CONF_WATER_SHUTOFF_ENTITY), str) and defaults.get(CONF_WATER_SHUTOFF_ENTITY) == "":
-            defaults[CONF_WATER_SHUTOFF_ENTITY] = None
+        defaults = self._step_defaults(_MAIN_KEYS, overlay=False)
+        if defaults is not None:
+            # Normalize blanks for option selectors: show truly empty fields when stored as ""
+            if isinstance(defaults.get(CONF_VOLUME_SENSOR), str) and defaults.get(CONF_VOLUME_SENSOR) == "":
+                defaults[CONF_VOLUME_SENSOR] = None
+            if isinstance(defaults.get(CONF_HOT_WATER_SENSOR), str) and defaults.get(CONF_HOT_WATER_SENSOR) == "":
+                defaults[CONF_HOT_WATER_SENSOR] = None
+            if isinstance(defaults.get(CONF_WATER_SHUTOFF_ENTITY), str) and defaults.get(CONF_WATER_SHUTOFF_ENTITY) == "":
+                defaults[CONF_WATER_SHUTOFF_ENTITY] = None
         return self.async_show_form(step_id="init", data_schema=_main_schema(defaults))
 
     async def async_step_low_flow(self, user_input: Optional[Dict[str, Any]] = None):
@@ -685,22 +860,7 @@ class WaterMonitorOptionsFlow(config_entries.OptionsFlow):
             return self._store()
 
         # Merge in any values already chosen on the init step (self._opts)
-        defaults = {
-            k: self._opts.get(k, self._existing.get(k, DEFAULTS.get(k)))
-            for k in [
-                CONF_LOW_FLOW_MAX_FLOW,
-                CONF_LOW_FLOW_SEED_S,
-                CONF_LOW_FLOW_MIN_S,
-                CONF_LOW_FLOW_CLEAR_IDLE_S,
-                CONF_LOW_FLOW_COUNTING_MODE,
-                CONF_LOW_FLOW_SMOOTHING_S,
-                CONF_LOW_FLOW_BASELINE_MARGIN_PCT,
-                CONF_LOW_FLOW_COOLDOWN_S,
-                CONF_LOW_FLOW_CLEAR_ON_HIGH_S,
-                CONF_WATER_SHUTOFF_ENTITY,
-                CONF_LOW_FLOW_AUTO_SHUTOFF,
-            ]
-        }
+        defaults = self._step_defaults(_LOW_FLOW_KEYS)
         return self.async_show_form(step_id="low_flow", data_schema=_low_flow_schema(defaults))
 
     async def async_step_tank_leak(self, user_input: Optional[Dict[str, Any]] = None):
@@ -713,32 +873,15 @@ class WaterMonitorOptionsFlow(config_entries.OptionsFlow):
             return self._store()
 
         # Merge in any values already chosen on the init/previous steps
-        defaults = {
-            k: self._opts.get(k, self._existing.get(k, DEFAULTS.get(k)))
-            for k in [
-                CONF_TANK_LEAK_MIN_REFILL_VOLUME,
-                CONF_TANK_LEAK_MAX_REFILL_VOLUME,
-                CONF_TANK_LEAK_TOLERANCE_PCT,
-                CONF_TANK_LEAK_REPEAT_COUNT,
-                CONF_TANK_LEAK_MAX_HOT_WATER_PCT,
-                CONF_TANK_LEAK_WINDOW_S,
-                CONF_TANK_LEAK_CLEAR_IDLE_S,
-                CONF_TANK_LEAK_COOLDOWN_S,
-                CONF_TANK_LEAK_MIN_REFILL_DURATION_S,
-                CONF_TANK_LEAK_MAX_REFILL_DURATION_S,
-                CONF_WATER_SHUTOFF_ENTITY,
-                CONF_TANK_LEAK_AUTO_SHUTOFF,
-            ]
-        }
+        defaults = self._step_defaults(_TANK_LEAK_KEYS)
         return self.async_show_form(step_id="tank_leak", data_schema=_tank_leak_schema(defaults))
 
     async def async_step_intelligent(self, user_input: Optional[Dict[str, Any]] = None):
         if user_input is not None:
-            if CONF_OCC_MODE_ENTITY in user_input and not user_input[CONF_OCC_MODE_ENTITY]:
-                user_input.pop(CONF_OCC_MODE_ENTITY, None)
-            for k in (CONF_OCC_STATE_AWAY, CONF_OCC_STATE_VACATION):
+            _drop_if_falsy(user_input, CONF_OCC_MODE_ENTITY)
+            for k in _OCC_CSV_KEYS:
                 if k in user_input and isinstance(user_input[k], str):
-                    norm = ", ".join([p.strip() for p in user_input[k].split(",") if p.strip()])
+                    norm = _normalize_csv(user_input[k])
                     if norm:
                         user_input[k] = norm
                     else:
@@ -749,19 +892,7 @@ class WaterMonitorOptionsFlow(config_entries.OptionsFlow):
             return self._store()
 
         # Merge in any values already chosen on the init/previous steps
-        defaults = {
-            k: self._opts.get(k, self._existing.get(k, DEFAULTS.get(k)))
-            for k in [
-                CONF_OCC_MODE_ENTITY,
-                CONF_OCC_STATE_AWAY,
-                CONF_OCC_STATE_VACATION,
-                CONF_INTEL_LEARNING_ENABLE,
-                CONF_INTEL_SUPPRESS_NOTIFICATIONS_DURING_LEARNING,
-                CONF_INTEL_MINIMUM_LEARNING_DAYS,
-                CONF_WATER_SHUTOFF_ENTITY,
-                CONF_INTEL_AUTO_SHUTOFF,
-            ]
-        }
+        defaults = self._step_defaults(_INTELLIGENT_KEYS)
         return self.async_show_form(step_id="intelligent", data_schema=_intelligent_schema(defaults))
 
     async def async_step_synthetic(self, user_input: Optional[Dict[str, Any]] = None):
@@ -769,11 +900,5 @@ class WaterMonitorOptionsFlow(config_entries.OptionsFlow):
             self._opts.update(user_input)
             return self._store()
 
-        defaults = {
-            k: self._existing.get(k, DEFAULTS.get(k))
-            for k in [
-                CONF_INCLUDE_SYNTHETIC_IN_DETECTORS,
-                CONF_INCLUDE_SYNTHETIC_IN_DAILY,
-            ]
-        }
+        defaults = self._step_defaults(_SYNTHETIC_KEYS, overlay=False)
         return self.async_show_form(step_id="synthetic", data_schema=ConfigFlow._synthetic_schema(self, defaults))
\ No newline at end of file
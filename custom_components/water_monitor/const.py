@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+from typing import Any, Mapping
+
 DOMAIN = "water_monitor"
 
+# Config keys are identifier-like literals, which CPython interns at compile time;
+# keep them that way (no spaces/punctuation) so dict lookups hit the identity fast path.
+
 # Existing config keys
 CONF_FLOW_SENSOR = "flow_sensor"
 CONF_VOLUME_SENSOR = "volume_sensor"
@@ -74,8 +80,22 @@ COUNTING_MODE_BASELINE_LATCH = "baseline_latch"
 CONF_LOW_FLOW_BASELINE_MARGIN_PCT = "low_flow_baseline_margin_pct"
 
 
-# Defaults
-DEFAULTS = {
+# Tank refill leak detector (optional) - config/option keys
+CONF_TANK_LEAK_ENABLE = "tank_refill_leak_enable"
+CONF_TANK_LEAK_MIN_REFILL_VOLUME = "tank_refill_min_volume"  # minimum session volume to be considered a refill
+CONF_TANK_LEAK_MAX_REFILL_VOLUME = "tank_refill_max_volume"  # optional: ignore events above this volume (0 disables)
+CONF_TANK_LEAK_TOLERANCE_PCT = "tank_refill_volume_tolerance_pct"  # percent similarity window
+CONF_TANK_LEAK_REPEAT_COUNT = "tank_refill_repeat_count"  # consecutive similar refills needed to trigger
+CONF_TANK_LEAK_WINDOW_S = "tank_refill_window_s"  # time window to count repeats
+CONF_TANK_LEAK_CLEAR_IDLE_S = "tank_refill_clear_idle_s"  # time with no matching refills to auto-clear
+CONF_TANK_LEAK_COOLDOWN_S = "tank_refill_cooldown_s"  # suppress re-triggering after clear
+CONF_TANK_LEAK_MIN_REFILL_DURATION_S = "tank_refill_min_duration_s"  # optional: ignore events shorter than this (0 disables)
+CONF_TANK_LEAK_MAX_REFILL_DURATION_S = "tank_refill_max_duration_s"  # optional: ignore events longer than this (0 disables)
+CONF_TANK_LEAK_MAX_HOT_WATER_PCT = "tank_refill_max_hot_water_pct"  # maximum hot water % to be considered a refill
+
+
+# Defaults (read-only; build merged copies with {**DEFAULTS, ...})
+_DEFAULTS: dict[str, Any] = {
     CONF_MIN_SESSION_VOLUME: 0.0,
     CONF_MIN_SESSION_DURATION: 0,
     CONF_SESSION_GAP_TOLERANCE: 5,
@@ -118,26 +138,7 @@ DEFAULTS = {
     CONF_LOW_FLOW_CLEAR_ON_HIGH_S: None,
     CONF_LOW_FLOW_BASELINE_MARGIN_PCT: 10.0,
     # Tank refill leak (disabled by default)
-    # Enable flag
-    # Thresholds and behavior
     # Note: volumes use the same unit as the configured volume sensor
-}
-
-# Tank refill leak detector (optional) - config/option keys
-CONF_TANK_LEAK_ENABLE = "tank_refill_leak_enable"
-CONF_TANK_LEAK_MIN_REFILL_VOLUME = "tank_refill_min_volume"  # minimum session volume to be considered a refill
-CONF_TANK_LEAK_MAX_REFILL_VOLUME = "tank_refill_max_volume"  # optional: ignore events above this volume (0 disables)
-CONF_TANK_LEAK_TOLERANCE_PCT = "tank_refill_volume_tolerance_pct"  # percent similarity window
-CONF_TANK_LEAK_REPEAT_COUNT = "tank_refill_repeat_count"  # consecutive similar refills needed to trigger
-CONF_TANK_LEAK_WINDOW_S = "tank_refill_window_s"  # time window to count repeats
-CONF_TANK_LEAK_CLEAR_IDLE_S = "tank_refill_clear_idle_s"  # time with no matching refills to auto-clear
-CONF_TANK_LEAK_COOLDOWN_S = "tank_refill_cooldown_s"  # suppress re-triggering after clear
-CONF_TANK_LEAK_MIN_REFILL_DURATION_S = "tank_refill_min_duration_s"  # optional: ignore events shorter than this (0 disables)
-CONF_TANK_LEAK_MAX_REFILL_DURATION_S = "tank_refill_max_duration_s"  # optional: ignore events longer than this (0 disables)
-CONF_TANK_LEAK_MAX_HOT_WATER_PCT = "tank_refill_max_hot_water_pct"  # maximum hot water % to be considered a refill
-
-# Extend defaults after keys are declared
-DEFAULTS.update({
     CONF_TANK_LEAK_ENABLE: False,
     CONF_TANK_LEAK_MIN_REFILL_VOLUME: 0.3,
     CONF_TANK_LEAK_MAX_REFILL_VOLUME: 0.0,  # 0 = disabled
@@ -149,7 +150,8 @@ DEFAULTS.update({
     CONF_TANK_LEAK_MIN_REFILL_DURATION_S: 0,
     CONF_TANK_LEAK_MAX_REFILL_DURATION_S: 0,
     CONF_TANK_LEAK_MAX_HOT_WATER_PCT: 25.0,  # filter out sessions with high hot water usage
-})
+}
+DEFAULTS: Mapping[str, Any] = MappingProxyType(_DEFAULTS)
 
 
 # Dispatcher signal helper for engine updates
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+import random
+import sys
+from bisect import insort
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime, timedelta, timezone
-from statistics import mean, pstdev
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_added_domain,
+    async_track_state_change_event,
+    async_track_time_change,
+)
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -25,15 +35,147 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coalesce per-session writes; stop() and HA's final-write hook flush anything pending
+_SAVE_DELAY_S = 10
+# Sessions recorded within this window are announced in a single dispatch
+_NOTIFY_BATCH_S = 0.1
+
+# Retention bounds: stored sessions (roughly 180 days) and daily summaries (~a year)
+_MAX_SESSIONS = 5000
+_MAX_DAYS = 370
+# Floor for the daily baseline spread, as a fraction of the median. With 3-7 prior
+# days the MAD collapses towards 0 whenever most days are alike.
+_BASELINE_MIN_REL_SPREAD = 0.15
+
+# Tracker fields read by ingest_state: the dedupe signature first (read on every
+# tracker update), the rest only once a new session is seen
+_INGEST_SIG_KEYS = ("last_session_volume", "last_session_duration", "last_session_synthetic_volume")
+_INGEST_REC_KEYS = ("last_session_average_flow", "last_session_hot_water_pct", "last_session_gapped_sessions")
+
 
 def _day_key(dt: datetime) -> str:
-    # Use local date string YYYY-MM-DD for daily buckets
-    return dt.astimezone().strftime("%Y-%m-%d")
+    # Use local date string YYYY-MM-DD (HA-configured time zone) for daily buckets
+    d = dt_util.as_local(dt)
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+# UTC offsets are whole quarter hours, so every timestamp in a 15-minute slot
+# falls on the same local day (an hour slot would not hold for e.g. UTC+5:30).
+# The zone is part of the key so a time zone change in HA is never served stale keys.
+@lru_cache(maxsize=4096)
+def _day_key_for_quarter(quarter: int, tz: Any) -> str:
+    d = datetime.fromtimestamp(quarter * 900, tz)
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+def _day_key_ts(ts: int) -> str:
+    """Day key for an epoch-seconds timestamp, memoized per 15-minute slot."""
+    return _day_key_for_quarter(int(ts) // 900, dt_util.DEFAULT_TIME_ZONE)
+
+
+def _median(xs: List[float]) -> float:
+    # Inputs here are a handful of daily totals; no need for statistics' generality
+    s = sorted(xs)
+    mid = len(s) // 2
+    return s[mid] if len(s) % 2 else (s[mid - 1] + s[mid]) / 2.0
+
+
+def _welford_add(slot: Dict[str, Any], duration_s: float, avg_flow: float) -> None:
+    """Fold one sample into a slot's running mean/M2 for duration (_d) and flow (_f)."""
+    n = int(slot.get("n", 0)) + 1
+    slot["n"] = n
+    for sfx, x in (("d", duration_s), ("f", avg_flow)):
+        mean = slot.get(f"mean_{sfx}", 0.0)
+        delta = x - mean
+        mean += delta / n
+        slot[f"mean_{sfx}"] = mean
+        slot[f"m2_{sfx}"] = slot.get(f"m2_{sfx}", 0.0) + delta * (x - mean)
+
+
+# Every possible "H|D" hourly bucket key, indexed by hour * 2 + is_weekend
+_DAY_TYPES = ("weekday", "weekend")
+_BUCKET_KEYS = tuple(f"{h}|{d}" for h in range(24) for d in _DAY_TYPES)
+
+# Per-slot sample cap. Hourly slots keep a uniform sample of everything seen (Vitter's
+# Algorithm R), matching the all-time quantile estimators rather than only the latest
+# sessions; context slots keep the most recent samples.
+_RESERVOIR_SIZE = 200
+_reservoir_rng = random.Random()
+
+# Quantiles tracked per stats slot with the P² estimator (Jain & Chlamtac, 1985)
+_P2_PCTS = (50, 90, 95, 99)
+
+
+def _p2_new() -> List[Dict[str, Any]]:
+    return [{"p": pct / 100.0, "q": []} for pct in _P2_PCTS]
+
+
+def _p2_add(est: Dict[str, Any], x: float) -> None:
+    """Update one P² estimator in O(1); the first five samples are kept sorted as-is."""
+    q = est["q"]
+    p = est["p"]
+    if len(q) < 5:
+        insort(q, x)
+        if len(q) == 5:
+            est["n"] = [0, 1, 2, 3, 4]
+            est["np"] = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        return
+    n = est["n"]
+    want = est["np"]
+    if x < q[0]:
+        q[0] = x
+        k = 0
+    elif x >= q[4]:
+        q[4] = x
+        k = 3
+    else:
+        k = 0
+        while x >= q[k + 1]:
+            k += 1
+    for i in range(k + 1, 5):
+        n[i] += 1
+    want[1] += p / 2
+    want[2] += p
+    want[3] += (1 + p) / 2
+    want[4] += 1
+    # Nudge the three middle markers toward their desired positions
+    for i in (1, 2, 3):
+        d = want[i] - n[i]
+        if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+            s = 1 if d > 0 else -1
+            qp = q[i] + s / (n[i + 1] - n[i - 1]) * (
+                (n[i] - n[i - 1] + s) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                + (n[i + 1] - n[i] - s) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+            )
+            if not q[i - 1] < qp < q[i + 1]:
+                # Parabolic step overshot a neighbour; fall back to linear
+                qp = q[i] + s * (q[i + s] - q[i]) / (n[i + s] - n[i])
+            q[i] = qp
+            n[i] += s
 
 
-@dataclass
+def _track(slot: Dict[str, Any], duration_s: float, avg_flow: float) -> None:
+    """Fold a sample into a slot's running moments and duration quantiles."""
+    _welford_add(slot, duration_s, avg_flow)
+    ests = slot.get("p2")
+    if ests is None:
+        ests = slot["p2"] = _p2_new()
+    for est in ests:
+        _p2_add(est, duration_s)
+
+
+def _track_rollup(slot: Dict[str, Any], duration_s: float, avg_flow: float) -> None:
+    """_track for roll-ups, which also keep their first samples for exact small-n quantiles."""
+    samples = slot.setdefault("durations", [])
+    if len(samples) < _RESERVOIR_SIZE:
+        samples.append(duration_s)
+    _track(slot, duration_s, avg_flow)
+
+
+# slots: up to 5000 of these stay resident, so skip a per-instance __dict__
+@dataclass(slots=True)
 class SessionRecord:
-    ended_at: str  # ISO8601
+    ended_at: int  # epoch seconds (UTC); stores before format v2 held ISO8601 strings
     volume: float
     duration_s: int
     avg_flow: float
@@ -45,17 +187,42 @@ class SessionRecord:
     occ_raw: Optional[str] = None
     occ_class: Optional[str] = None  # home | away | vacation | night
     people_bin: Optional[str] = None  # '0' | '1' | '2-3' | '4+'
+    # Local day bucket (YYYY-MM-DD), fixed once recorded
+    day_key: str = ""
+    # Local hour (0-23) and weekday (Mon=0) at end time, derived once when recorded
+    local_hour: Optional[int] = None
+    local_weekday: Optional[int] = None
+
+
+# Sessions are persisted column-wise (one list per field) from store format v2 on
+_SESSION_FIELDS = tuple(f.name for f in fields(SessionRecord))
+_STORE_FORMAT = 2
+# Low-cardinality string columns; JSON decoding gives every row its own copy
+_SESSION_LABEL_FIELDS = ("occ_raw", "occ_class", "people_bin", "day_key")
 
 
 @dataclass
 class EngineState:
-    sessions: List[SessionRecord] = field(default_factory=list)
+    # Ring buffer: appending past _MAX_SESSIONS drops the oldest record
+    sessions: Deque[SessionRecord] = field(default_factory=lambda: deque(maxlen=_MAX_SESSIONS))
+    # Running per-day sums keyed by day_key: vol_sum, synth_sum, dur_sum, hot_sum, count
+    day_agg: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    # Kept in chronological insertion order so the oldest day is always first
     daily: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     # Simple long-horizon stats for duration/flow by (hour, day_type)
-    # Structure: {"H|D": {"durations": [int], "flows": [float], "count": int, "last_updated": iso}}
+    # Structure: {"H|D": {"durations": [int], "flows": [float], "count": int, "last_updated": iso,
+    #                     "n": int, "mean_d": float, "m2_d": float, "mean_f": float, "m2_f": float,
+    #                     "p2": [P² estimator per _P2_PCTS]}}
     hourly_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
-    # Context-aware stats: (hour|day_type|occ_class|people_bin)
+    # Same running moments/quantiles rolled up per hour ("H") and across all buckets,
+    # so fallback levels never merge sample lists
+    hour_rollup: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    global_rollup: Dict[str, Any] = field(default_factory=dict)
+    # Context-aware stats: (hour|day_type|occ_class|people_bin); durations/flows are the
+    # most recent _RESERVOIR_SIZE samples held in deques (lists once serialized)
     context_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Context slots rolled up across people bins, keyed "hour|day_type|occ_class"
+    context_rollup: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 
 class WaterMonitorEngine:
@@ -72,11 +239,28 @@ class WaterMonitorEngine:
     ) -> None:
         self.hass = hass
         self.entry_id = entry_id
-        self._config = config
+        self.update_config(config)
         self._store: Store[dict] = Store(hass, 1, f"{DOMAIN}_{entry_id}_engine.json")
         self._state = EngineState()
         self._last_session_sig: Optional[tuple[float, int]] = None
         self._daily_unsub = None
+        self._pending_records: List[Dict[str, Any]] = []
+        # Set on any state mutation; cleared once the payload is handed to the Store
+        self._dirty = False
+        # people_bin kept current from person.* state changes instead of scanning all states
+        self._people_bin = "0"
+        self._person_unsub = None
+        self._person_added_unsub = None
+        # Last computed stats per bucket label: {bucket: (slot n, stats)}
+        self._stats_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._notify_unsub = None
+
+    def update_config(self, config: Dict[str, Any]) -> None:
+        """Adopt a new merged config and re-derive the values read per session."""
+        self._config = config
+        self._occ_entity = str(config.get(CONF_OCC_MODE_ENTITY) or "")
+        self._away_states = frozenset(self._split_states(config.get(CONF_OCC_STATE_AWAY)))
+        self._vacation_states = frozenset(self._split_states(config.get(CONF_OCC_STATE_VACATION)))
 
     async def start(self) -> None:
         await self._load()
@@ -85,49 +269,189 @@ class WaterMonitorEngine:
             self._daily_unsub = async_track_time_change(
                 self.hass, self._handle_daily_tick, hour=3, minute=10, second=0
             )
+        if self._person_added_unsub is None:
+            self._person_added_unsub = async_track_state_added_domain(
+                self.hass, "person", self._on_person_added
+            )
+        self._track_people()
 
     async def stop(self) -> None:
         if self._daily_unsub is not None:
             self._daily_unsub()
             self._daily_unsub = None
+        if self._person_added_unsub is not None:
+            self._person_added_unsub()
+            self._person_added_unsub = None
+        if self._person_unsub is not None:
+            self._person_unsub()
+            self._person_unsub = None
+        if self._notify_unsub is not None:
+            self._notify_unsub()
+            self._flush_notify()
         await self._save()
 
+    @callback
+    def _flush_notify(self, _now=None) -> None:
+        """Announce all sessions recorded since the last flush in one dispatch."""
+        self._notify_unsub = None
+        records, self._pending_records = self._pending_records, []
+        if not records:
+            return
+        async_dispatcher_send(self.hass, engine_signal(self.entry_id), {
+            "type": "ingest",
+            "event": "sessions_recorded",
+            "records": records,
+            # Latest record, for subscribers that only read a single one
+            "record": records[-1],
+        })
+
     async def _load(self) -> None:
         try:
             data = await self._store.async_load()
             if not data:
                 return
-            sessions = [SessionRecord(**rec) for rec in data.get("sessions", [])]
-            self._state.sessions = sessions
-            self._state.daily = data.get("daily", {})
+            self._stats_cache.clear()
+            raw = data.get("sessions") or []
+            if data.get("v", 1) >= 2:
+                for name in _SESSION_LABEL_FIELDS:
+                    if name in raw:
+                        raw[name] = [sys.intern(v) if isinstance(v, str) else v for v in raw[name]]
+                names = [name for name in _SESSION_FIELDS if name in raw]
+                sessions = [
+                    SessionRecord(**dict(zip(names, row)))
+                    for row in zip(*(raw[name] for name in names))
+                ]
+            else:
+                sessions = [SessionRecord(**rec) for rec in raw]
+            # Drop records whose ended_at cannot become an epoch so they are not saved back
+            kept: List[SessionRecord] = []
+            for rec in sessions:
+                try:
+                    if isinstance(rec.ended_at, str):
+                        # Legacy ISO timestamp: parse once and keep the epoch from here on
+                        rec.ended_at = int(datetime.fromisoformat(rec.ended_at).timestamp())
+                    else:
+                        rec.ended_at = int(rec.ended_at)
+                except (TypeError, ValueError, OverflowError):
+                    continue
+                if not rec.day_key:
+                    # Legacy record saved before day_key existed
+                    rec.day_key = _day_key_ts(rec.ended_at)
+                if rec.local_hour is None or rec.local_weekday is None:
+                    local = datetime.fromtimestamp(rec.ended_at, dt_util.DEFAULT_TIME_ZONE)
+                    rec.local_hour, rec.local_weekday = local.hour, local.weekday()
+                kept.append(rec)
+            sessions = kept
+            self._state.sessions = deque(sessions, maxlen=_MAX_SESSIONS)
+            if "day_agg" in data:
+                self._state.day_agg = data["day_agg"]
+            else:
+                # Legacy store: rebuild aggregates from the retained sessions
+                for rec in sessions:
+                    if rec.day_key:
+                        self._add_to_day_agg(rec)
+            self._state.daily = dict(sorted(data.get("daily", {}).items()))
             self._state.hourly_stats = data.get("hourly_stats", {})
             self._state.context_stats = data.get("context_stats", {})
+            # Seed running moments for slots saved before they were tracked
+            for stats in (self._state.hourly_stats, self._state.context_stats):
+                for slot in stats.values():
+                    if "n" not in slot:
+                        for d, f in zip(slot.get("durations", []), slot.get("flows", [])):
+                            _welford_add(slot, float(d), float(f))
+            for slot in self._state.context_stats.values():
+                slot["durations"] = deque(slot.get("durations", ()), maxlen=_RESERVOIR_SIZE)
+                slot["flows"] = deque(slot.get("flows", ()), maxlen=_RESERVOIR_SIZE)
+            for stats in (self._state.hourly_stats, self._state.context_stats):
+                for slot in stats.values():
+                    if "p2" in slot:
+                        continue
+                    slot["p2"] = _p2_new()
+                    for d in slot.get("durations", ()):
+                        for est in slot["p2"]:
+                            _p2_add(est, float(d))
+            if "global_rollup" in data:
+                self._state.hour_rollup = data.get("hour_rollup", {})
+                self._state.global_rollup = data["global_rollup"]
+            else:
+                for key, slot in self._state.hourly_stats.items():
+                    hour_slot = self._state.hour_rollup.setdefault(key.split("|", 1)[0], {})
+                    for d, f in zip(slot.get("durations", []), slot.get("flows", [])):
+                        _track_rollup(hour_slot, float(d), float(f))
+                        _track_rollup(self._state.global_rollup, float(d), float(f))
+            if "context_rollup" in data:
+                self._state.context_rollup = data["context_rollup"]
+            else:
+                for key, slot in self._state.context_stats.items():
+                    ctx_slot = self._state.context_rollup.setdefault(key.rsplit("|", 1)[0], {})
+                    for d, f in zip(slot.get("durations", ()), slot.get("flows", ())):
+                        _track_rollup(ctx_slot, float(d), float(f))
         except Exception as e:
             _LOGGER.warning("Engine state load failed: %s", e)
 
+    def _data_to_save(self) -> Dict[str, Any]:
+        self._dirty = False
+        sessions = self._state.sessions
+        return {
+            "v": _STORE_FORMAT,
+            "sessions": {name: [getattr(rec, name) for rec in sessions] for name in _SESSION_FIELDS},
+            "daily": self._state.daily,
+            "day_agg": self._state.day_agg,
+            "hourly_stats": self._state.hourly_stats,
+            "hour_rollup": self._state.hour_rollup,
+            "global_rollup": self._state.global_rollup,
+            "context_stats": {
+                key: {**slot, "durations": list(slot["durations"]), "flows": list(slot["flows"])}
+                for key, slot in self._state.context_stats.items()
+            },
+            "context_rollup": self._state.context_rollup,
+        }
+
     async def _save(self) -> None:
+        if not self._dirty:
+            return
         try:
-            data = {
-                "sessions": [rec.__dict__ for rec in self._state.sessions],
-                "daily": self._state.daily,
-                "hourly_stats": self._state.hourly_stats,
-                "context_stats": self._state.context_stats,
-            }
-            await self._store.async_save(data)
+            # Also cancels any pending delayed write
+            await self._store.async_save(self._data_to_save())
         except Exception as e:
+            self._dirty = True
             _LOGGER.warning("Engine state save failed: %s", e)
 
     @callback
-    async def ingest_state(self, state: Dict[str, Any]) -> None:
+    def _schedule_save(self) -> None:
+        """Debounced save; the payload is only built when the write actually happens."""
+        self._store.async_delay_save(self._data_to_save, _SAVE_DELAY_S)
+
+    def _add_to_day_agg(self, rec: SessionRecord) -> None:
+        agg = self._state.day_agg.get(rec.day_key)
+        if agg is None:
+            agg = self._state.day_agg[rec.day_key] = {
+                "vol_sum": 0.0, "synth_sum": 0.0, "dur_sum": 0.0, "hot_sum": 0.0, "count": 0,
+            }
+        agg["vol_sum"] += float(rec.volume or 0.0)
+        agg["synth_sum"] += float(rec.synth_volume or 0.0)
+        agg["dur_sum"] += rec.duration_s
+        agg["hot_sum"] += float(rec.hot_pct or 0.0)
+        agg["count"] += 1
+
+    def _append_session(self, rec: SessionRecord) -> None:
+        """Append a record, fold it into its day's aggregate and keep storage bounded."""
+        self._state.sessions.append(rec)
+        self._add_to_day_agg(rec)
+        self._dirty = True
+
+    @callback
+    def ingest_state(self, state: Dict[str, Any]) -> None:
         """
         Ingest tracker state_data. If a new last_session_* has appeared, record it.
         """
         # Only run when intelligent detection is toggled on, else just collect sessions.
         # Collection is lightweight; always enabled.
-        vol = float(state.get("last_session_volume", 0.0) or 0.0)
-        dur = int(state.get("last_session_duration", 0) or 0)
+        vol, dur, synth = map(state.get, _INGEST_SIG_KEYS)
+        vol = float(vol or 0.0)
+        dur = int(dur or 0)
         # Exclude synthetic contribution from engine stats/analysis
-        synth = float(state.get("last_session_synthetic_volume", 0.0) or 0.0)
+        synth = float(synth or 0.0)
         vol_eff = max(0.0, vol - max(0.0, synth))
         if vol_eff <= 0 or dur <= 0:
             return
@@ -138,7 +462,8 @@ class WaterMonitorEngine:
 
         self._last_session_sig = sig
 
-        avg = float(state.get("last_session_average_flow", 0.0) or 0.0)
+        avg, hot_pct, gaps = map(state.get, _INGEST_REC_KEYS)
+        avg = float(avg or 0.0)
         # Adjust average flow to remove synthetic portion (volume/time)
         try:
             if dur > 0 and synth > 0:
@@ -147,15 +472,16 @@ class WaterMonitorEngine:
                     avg = 0.0
         except Exception:
             pass
-        hot_pct = float(state.get("last_session_hot_water_pct", 0.0) or 0.0)
-        gaps = int(state.get("last_session_gapped_sessions", 0) or 0)
+        hot_pct = float(hot_pct or 0.0)
+        gaps = int(gaps or 0)
 
         now_utc = datetime.now(timezone.utc)
-        ended_at = now_utc.isoformat()
+        local = dt_util.as_local(now_utc)
 
         # Classify context at end time
         occ_raw, occ_class, people_bin = self._classify_context(now_utc)
 
+        ended_at = int(now_utc.timestamp())
         rec = SessionRecord(
             ended_at=ended_at,
             volume=round(vol_eff, 6),
@@ -167,65 +493,67 @@ class WaterMonitorEngine:
             occ_raw=occ_raw,
             occ_class=occ_class,
             people_bin=people_bin,
+            day_key=_day_key_ts(ended_at),
+            local_hour=local.hour,
+            local_weekday=local.weekday(),
         )
-        self._state.sessions.append(rec)
-        # Keep storage bounded (e.g., last 180 days sessions)
-        if len(self._state.sessions) > 5000:
-            self._state.sessions = self._state.sessions[-5000:]
+        self._append_session(rec)
         # Update hourly/context stats (first pass: hour + day_type only)
-        try:
-            dt = datetime.fromisoformat(ended_at)
-        except Exception:
-            dt = now_utc
-        hour, day_type = self._local_hour_and_daytype(dt)
-        self._update_hourly_stats(hour, day_type, rec.duration_s, rec.avg_flow)
+        hour, day_type = rec.local_hour, _DAY_TYPES[rec.local_weekday >= 5]
+        now_iso = now_utc.isoformat()
+        self._update_hourly_stats(hour, day_type, rec.duration_s, rec.avg_flow, now_iso)
         # Update context-aware stats
-        self._update_context_stats(hour, day_type, occ_class, people_bin, rec.duration_s, rec.avg_flow)
-        await self._save()
-        # Notify interested entities
-        async_dispatcher_send(self.hass, engine_signal(self.entry_id), {
-            "type": "ingest",
-            "event": "session_recorded",
-            "record": rec.__dict__,
-        })
+        self._update_context_stats(hour, day_type, occ_class, people_bin, rec.duration_s, rec.avg_flow, now_iso)
+        self._schedule_save()
+        # Notify interested entities (coalesced); subscribers expect an ISO ended_at
+        record = asdict(rec)
+        record["ended_at"] = now_iso
+        self._pending_records.append(record)
+        if self._notify_unsub is None:
+            self._notify_unsub = async_call_later(self.hass, _NOTIFY_BATCH_S, self._flush_notify)
 
     async def analyze_yesterday(self) -> Dict[str, Any]:
         """Compute daily summary for yesterday and store it."""
-        now_local = datetime.now().astimezone()
+        now_local = dt_util.now()
         y_local = (now_local - timedelta(days=1)).replace(hour=23, minute=59, second=59, microsecond=0)
         y_key = _day_key(y_local)
 
-        # Sessions are stored with UTC timestamps; convert to local day bucket
-        day_sessions: List[SessionRecord] = []
-        for rec in self._state.sessions:
-            try:
-                dt = datetime.fromisoformat(rec.ended_at)
-            except Exception:
-                continue
-            if _day_key(dt) == y_key:
-                day_sessions.append(rec)
+        # Running sums were accumulated per local day at ingest time
+        agg = self._state.day_agg.get(y_key)
+        session_count = int(agg["count"]) if agg else 0
 
         # Daily totals: optionally include synthetic when configured.
         include_synth_daily = bool(self._config.get(CONF_SYNTHETIC_ENABLE, False) and self._config.get(CONF_INCLUDE_SYNTHETIC_IN_DAILY, False))
-        total_vol = 0.0
-        for s in day_sessions:
-            base = float(s.volume or 0.0)
-            add = float(s.synth_volume or 0.0) if include_synth_daily else 0.0
-            total_vol += base + add
-        session_count = len(day_sessions)
-        avg_dur = mean([s.duration_s for s in day_sessions]) if day_sessions else 0.0
-        avg_hot = mean([s.hot_pct for s in day_sessions]) if day_sessions else 0.0
-
-        # Baseline: last 7 days (excluding yesterday)
-        last7: List[float] = []
-        for d in range(2, 9):
-            dk = _day_key(now_local - timedelta(days=d))
-            prev = self._state.daily.get(dk)
-            if prev:
-                last7.append(float(prev.get("total_volume", 0.0) or 0.0))
-
-        baseline_mean = mean(last7) if last7 else 0.0
-        baseline_std = pstdev(last7) if len(last7) >= 2 else 0.0
+        if session_count:
+            total_vol = agg["vol_sum"] + (agg["synth_sum"] if include_synth_daily else 0.0)
+            avg_dur = agg["dur_sum"] / session_count
+            avg_hot = agg["hot_sum"] / session_count
+        else:
+            total_vol = avg_dur = avg_hot = 0.0
+
+        def prior_totals(days_back) -> List[float]:
+            out: List[float] = []
+            for d in days_back:
+                prev = self._state.daily.get(_day_key(now_local - timedelta(days=d)))
+                if prev:
+                    out.append(float(prev.get("total_volume", 0.0) or 0.0))
+            return out
+
+        # Baseline: prefer the same weekday over the prior 4 weeks (household use is
+        # weekly-seasonal); otherwise the last 7 days (excluding yesterday).
+        same_dow = prior_totals((8, 15, 22, 29))
+        if len(same_dow) >= 3:
+            xs, method = same_dow, "mad_weekday"
+        else:
+            xs, method = prior_totals(range(2, 9)), "mad"
+
+        # Robust center/spread: median and MAD scaled to be comparable with a std dev.
+        # Fields keep their historical names (baseline_mean/std, threshold_3sigma).
+        baseline_mean = _median(xs) if xs else 0.0
+        baseline_std = (
+            max(1.4826 * _median([abs(x - baseline_mean) for x in xs]), _BASELINE_MIN_REL_SPREAD * baseline_mean)
+            if len(xs) >= 2 else 0.0
+        )
         threshold = baseline_mean + 3 * baseline_std if baseline_std > 0 else None
         anomaly = bool(threshold is not None and total_vol > threshold)
 
@@ -238,15 +566,24 @@ class WaterMonitorEngine:
             "baseline_mean": round(baseline_mean, 3),
             "baseline_std": round(baseline_std, 3),
             "threshold_3sigma": round(threshold, 3) if threshold is not None else None,
+            "baseline_method": method,
             "anomaly": anomaly,
         }
 
-        self._state.daily[y_key] = summary
-        # Keep daily map reasonable (e.g., 365 days)
-        if len(self._state.daily) > 370:
-            # prune oldest
-            for dk in sorted(self._state.daily.keys())[:-370]:
-                self._state.daily.pop(dk, None)
+        daily = self._state.daily
+        # A re-run that reproduces the stored summary changes nothing, so skip the write
+        if daily.get(y_key) != summary:
+            # Re-insert so a re-run for the same day still lands last
+            daily.pop(y_key, None)
+            daily[y_key] = summary
+            # Keep daily map reasonable (e.g., 365 days); prune oldest
+            while len(daily) > _MAX_DAYS:
+                del daily[next(iter(daily))]
+            # Simulated history can add older days late, so evict by key rather than order
+            day_agg = self._state.day_agg
+            while len(day_agg) > _MAX_DAYS:
+                del day_agg[min(day_agg)]
+            self._dirty = True
         await self._save()
 
         _LOGGER.info("Daily water summary for %s: %s", y_key, summary)
@@ -274,32 +611,37 @@ class WaterMonitorEngine:
 
     def _local_hour_and_daytype(self, dt: datetime) -> Tuple[int, str]:
         try:
-            local = dt.astimezone()
+            local = dt_util.as_local(dt)
         except Exception:
-            local = datetime.now().astimezone()
-        hour = local.hour
-        day_type = "weekend" if local.weekday() >= 5 else "weekday"
-        return hour, day_type
+            local = dt_util.now()
+        return local.hour, _DAY_TYPES[local.weekday() >= 5]
 
     def _bucket_key(self, hour: int, day_type: str) -> str:
-        return f"{hour}|{day_type}"
+        return _BUCKET_KEYS[hour * 2 + (day_type == "weekend")]
 
-    def _update_hourly_stats(self, hour: int, day_type: str, duration_s: int, avg_flow: float) -> None:
+    def _update_hourly_stats(self, hour: int, day_type: str, duration_s: int, avg_flow: float, now_iso: str) -> None:
         key = self._bucket_key(hour, day_type)
         slot = self._state.hourly_stats.setdefault(key, {"durations": [], "flows": [], "count": 0, "last_updated": None})
-        # Append and bound arrays for simple online storage; size cap per bucket ~200
-        slot["durations"].append(int(duration_s))
-        if len(slot["durations"]) > 200:
-            slot["durations"] = slot["durations"][-200:]
         try:
             f = float(avg_flow)
         except Exception:
             f = 0.0
-        slot["flows"].append(f)
-        if len(slot["flows"]) > 200:
-            slot["flows"] = slot["flows"][-200:]
+        durations = slot["durations"]
+        if len(durations) < _RESERVOIR_SIZE:
+            durations.append(int(duration_s))
+            slot["flows"].append(f)
+        else:
+            # Sample k (1-based) replaces a random entry with probability size/k
+            j = _reservoir_rng.randrange(int(slot.get("n", 0)) + 1)
+            if j < _RESERVOIR_SIZE:
+                durations[j] = int(duration_s)
+                slot["flows"][j] = f
+        d = float(duration_s)
+        _track(slot, d, f)
+        _track_rollup(self._state.hour_rollup.setdefault(str(hour), {}), d, f)
+        _track_rollup(self._state.global_rollup, d, f)
         slot["count"] = len(slot["durations"])  # simple count
-        slot["last_updated"] = datetime.now(timezone.utc).isoformat()
+        slot["last_updated"] = now_iso
 
     def _ctx_key(self, hour: int, day_type: str, occ_class: str, people_bin: str) -> str:
         return f"{hour}|{day_type}|{occ_class}|{people_bin}"
@@ -312,28 +654,39 @@ class WaterMonitorEngine:
         people_bin: Optional[str],
         duration_s: int,
         avg_flow: float,
+        now_iso: str,
     ) -> None:
         oc = occ_class or "unknown"
         pb = people_bin or "?"
         key = self._ctx_key(hour, day_type, oc, pb)
-        slot = self._state.context_stats.setdefault(key, {"durations": [], "flows": [], "count": 0, "last_updated": None})
+        slot = self._state.context_stats.get(key)
+        if slot is None:
+            slot = self._state.context_stats[key] = {
+                "durations": deque(maxlen=_RESERVOIR_SIZE),
+                "flows": deque(maxlen=_RESERVOIR_SIZE),
+                "count": 0,
+                "last_updated": None,
+            }
+        # Bounded deques drop the oldest sample on append, without copying
         slot["durations"].append(int(duration_s))
-        if len(slot["durations"]) > 200:
-            slot["durations"] = slot["durations"][-200:]
         try:
             f = float(avg_flow)
         except Exception:
             f = 0.0
         slot["flows"].append(f)
-        if len(slot["flows"]) > 200:
-            slot["flows"] = slot["flows"][-200:]
+        d = float(duration_s)
+        _track(slot, d, f)
+        _track_rollup(self._state.context_rollup.setdefault(f"{hour}|{day_type}|{oc}", {}), d, f)
         slot["count"] = len(slot["durations"])  # simple count
-        slot["last_updated"] = datetime.now(timezone.utc).isoformat()
+        slot["last_updated"] = now_iso
 
     def _percentile(self, data: List[float] | List[int], pct: float) -> float:
         if not data:
             return 0.0
-        xs = sorted(float(x) for x in data)
+        return self._sorted_percentile(sorted(float(x) for x in data), pct)
+
+    @staticmethod
+    def _sorted_percentile(xs: List[float], pct: float) -> float:
         if len(xs) == 1:
             return xs[0]
         # Clamp percentile to [0, 100]
@@ -344,51 +697,68 @@ class WaterMonitorEngine:
         frac = idx - lo
         return xs[lo] * (1.0 - frac) + xs[hi] * frac
 
+    @staticmethod
+    def _moments(slot: Dict[str, Any]) -> Dict[str, Any]:
+        """Mean and population std of durations from a slot's running moments."""
+        n = int(slot.get("n", 0))
+        if n <= 0:
+            return {}
+        return {
+            "mean": round(slot.get("mean_d", 0.0), 1),
+            "std": round((slot.get("m2_d", 0.0) / n) ** 0.5, 1),
+        }
+
+    def _slot_stats(self, slot: Dict[str, Any], bucket: str, level: int) -> Dict[str, Any]:
+        """Count, duration quantiles and moments for a tracked slot, labelled for the ladder.
+
+        Every update bumps the slot's n, so (bucket, n) identifies a result; the
+        intelligent leak sensor asks for the same bucket on each tracker update.
+        """
+        n = int(slot.get("n", 0))
+        hit = self._stats_cache.get(bucket)
+        if hit is not None and hit[0] == n:
+            return dict(hit[1])
+        st: Dict[str, Any] = {"count": n}
+        samples = slot.get("durations")
+        if samples and n <= len(samples):
+            # The retained sample is still the whole history: exact percentiles are cheap
+            # here, and P² needs a few hundred samples before its tail markers settle.
+            xs = sorted(float(x) for x in samples)
+            for pct in _P2_PCTS:
+                st[f"p{pct}"] = round(self._sorted_percentile(xs, pct), 1)
+        else:
+            ests = slot.get("p2") or _p2_new()
+            value = 0.0
+            for pct, est in zip(_P2_PCTS, ests):
+                q = est["q"]
+                # Until five samples exist the estimator holds them verbatim. Independent
+                # estimators can cross slightly on small samples, so keep them monotone.
+                value = max(value, q[2] if len(q) == 5 and "n" in est else self._percentile(q, pct))
+                st[f"p{pct}"] = round(value, 1)
+        st.update(self._moments(slot))
+        st["bucket"] = bucket
+        st["level"] = level
+        self._stats_cache[bucket] = (n, st)
+        return dict(st)
+
     def get_simple_bucket_stats(self, hour: int, day_type: str) -> Dict[str, Any]:
         """Return simple stats for a bucket and fallbacks if needed.
 
         Fallbacks: (hour, day_type) -> (hour) -> global
         """
-        def make_stats(durations: List[int]) -> Dict[str, Any]:
-            return {
-                "count": len(durations),
-                "p50": round(self._percentile(durations, 50), 1),
-                "p90": round(self._percentile(durations, 90), 1),
-                "p95": round(self._percentile(durations, 95), 1),
-                "p99": round(self._percentile(durations, 99), 1),
-            }
-
         # Exact bucket
         key = self._bucket_key(hour, day_type)
         slot = self._state.hourly_stats.get(key)
-        if slot and slot.get("durations"):
-            durs = [int(x) for x in slot["durations"] if isinstance(x, (int, float))]
-            st = make_stats(durs)
-            st["bucket"] = key
-            st["level"] = 1
-            return st
-
-        # Hour-only fallback (merge weekday+weekend for this hour)
-        merged: List[int] = []
-        for dtp in ("weekday", "weekend"):
-            s = self._state.hourly_stats.get(self._bucket_key(hour, dtp))
-            if s and s.get("durations"):
-                merged.extend(int(x) for x in s["durations"] if isinstance(x, (int, float)))
-        if merged:
-            st = make_stats(merged)
-            st["bucket"] = f"{hour}|*"
-            st["level"] = 2
-            return st
-
-        # Global fallback: merge everything
-        all_durs: List[int] = []
-        for s in self._state.hourly_stats.values():
-            if s and s.get("durations"):
-                all_durs.extend(int(x) for x in s["durations"] if isinstance(x, (int, float)))
-        st = make_stats(all_durs)
-        st["bucket"] = "*"
-        st["level"] = 3
-        return st
+        if slot and slot.get("n"):
+            return self._slot_stats(slot, key, 1)
+
+        # Hour-only fallback (weekday+weekend rolled up for this hour)
+        slot = self._state.hour_rollup.get(str(hour))
+        if slot and slot.get("n"):
+            return self._slot_stats(slot, f"{hour}|*", 2)
+
+        # Global fallback
+        return self._slot_stats(self._state.global_rollup, "*", 3)
 
     def get_context_bucket_stats(
         self,
@@ -406,34 +776,17 @@ class WaterMonitorEngine:
         4) hour
         5) global
         """
-
-        def make_stats(durations: List[int], bucket: str, level: int) -> Dict[str, Any]:
-            return {
-                "bucket": bucket,
-                "level": level,
-                "count": len(durations),
-                "p50": round(self._percentile(durations, 50), 1),
-                "p90": round(self._percentile(durations, 90), 1),
-                "p95": round(self._percentile(durations, 95), 1),
-                "p99": round(self._percentile(durations, 99), 1),
-            }
-
         oc = (occ_class or "unknown")
         pb = (people_bin or "?")
         # 1: exact
         key = self._ctx_key(hour, day_type, oc, pb)
         slot = self._state.context_stats.get(key)
-        if slot and slot.get("durations"):
-            d = [int(x) for x in slot["durations"] if isinstance(x, (int, float))]
-            return make_stats(d, key, 1)
-        # 2: wildcard people_bin
-        merged: List[int] = []
-        for bin_opt in ("0", "1", "2-3", "4+", "?"):
-            s = self._state.context_stats.get(self._ctx_key(hour, day_type, oc, bin_opt))
-            if s and s.get("durations"):
-                merged.extend(int(x) for x in s["durations"] if isinstance(x, (int, float)))
-        if merged:
-            return make_stats(merged, f"{hour}|{day_type}|{oc}|*", 2)
+        if slot and slot.get("n"):
+            return self._slot_stats(slot, key, 1)
+        # 2: wildcard people_bin (rolled up at ingest)
+        slot = self._state.context_rollup.get(f"{hour}|{day_type}|{oc}")
+        if slot and slot.get("n"):
+            return self._slot_stats(slot, f"{hour}|{day_type}|{oc}|*", 2)
         # 3/4/5: fall back to simpler ladders
         st = self.get_simple_bucket_stats(hour, day_type)
         st["level"] = max(3, int(st.get("level", 3)))
@@ -442,6 +795,42 @@ class WaterMonitorEngine:
     # -------------------------
     # Context classification helpers
     # -------------------------
+    @callback
+    def _track_people(self) -> None:
+        """(Re)subscribe to all person entities and recount who is home."""
+        if self._person_unsub is not None:
+            self._person_unsub()
+            self._person_unsub = None
+        persons = [st.entity_id for st in self.hass.states.async_all("person")]
+        if persons:
+            self._person_unsub = async_track_state_change_event(
+                self.hass, persons, self._on_person_changed
+            )
+        self._recount_people()
+
+    @callback
+    def _on_person_added(self, _event) -> None:
+        self._track_people()
+
+    @callback
+    def _on_person_changed(self, _event) -> None:
+        self._recount_people()
+
+    @callback
+    def _recount_people(self) -> None:
+        people_home = 0
+        for st in self.hass.states.async_all("person"):
+            people_home += str(st.state).lower() == "home"
+
+        if people_home <= 0:
+            self._people_bin = "0"
+        elif people_home == 1:
+            self._people_bin = "1"
+        elif 2 <= people_home <= 3:
+            self._people_bin = "2-3"
+        else:
+            self._people_bin = "4+"
+
     def _split_states(self, value: Optional[str]) -> List[str]:
         if not value:
             return []
@@ -450,23 +839,20 @@ class WaterMonitorEngine:
     def _classify_context(self, dt_utc: datetime) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """Return (occupancy_raw, occupancy_class, people_bin) for a given time."""
         try:
-            local = dt_utc.astimezone()
+            local = dt_util.as_local(dt_utc)
         except Exception:
-            local = datetime.now().astimezone()
+            local = dt_util.now()
         hour = local.hour
 
-        occ_ent = str(self._config.get(CONF_OCC_MODE_ENTITY) or "")
         occ_raw = None
-        if occ_ent:
-            st = self.hass.states.get(occ_ent)
+        if self._occ_entity:
+            st = self.hass.states.get(self._occ_entity)
             if st and st.state not in (None, "unknown", "unavailable"):
                 occ_raw = str(st.state)
 
-        away_list = self._split_states(self._config.get(CONF_OCC_STATE_AWAY))
-        vac_list = self._split_states(self._config.get(CONF_OCC_STATE_VACATION))
-        if occ_raw and occ_raw in vac_list:
+        if occ_raw and occ_raw in self._vacation_states:
             occ_class = "vacation"
-        elif occ_raw and occ_raw in away_list:
+        elif occ_raw and occ_raw in self._away_states:
             occ_class = "away"
         else:
             # Simple night heuristic: 0-5 local hours considered night
@@ -475,32 +861,8 @@ class WaterMonitorEngine:
             else:
                 occ_class = "home"
 
-        # Count people.* at home
-        people_home = 0
-        try:
-            for eid, st in self.hass.states.async_all("person"):
-                pass  # incorrect API, fallback below
-        except Exception:
-            pass
-        # Use states list in hass
-        try:
-            for st in self.hass.states.async_all():
-                if st.domain == "person" and str(st.state).lower() == "home":
-                    people_home += 1
-        except Exception:
-            # Very defensive
-            pass
-
-        if people_home <= 0:
-            people_bin = "0"
-        elif people_home == 1:
-            people_bin = "1"
-        elif 2 <= people_home <= 3:
-            people_bin = "2-3"
-        else:
-            people_bin = "4+"
-
-        return occ_raw, occ_class, people_bin
+        # person.* at home, maintained by _recount_people
+        return occ_raw, occ_class, self._people_bin
 
     def get_context_stats_for_now(self) -> Dict[str, Any]:
         now = datetime.now(timezone.utc)
@@ -520,18 +882,21 @@ class WaterMonitorEngine:
     # Simulation tooling (to accelerate baseline creation)
     # -------------------------
     async def simulate_history(self, days: int = 14, seed: Optional[int] = None, include_irrigation: bool = True) -> Dict[str, Any]:
-        import random
-        if seed is not None:
-            random.seed(int(seed))
+        # Own generator: seeding must not reset the shared module-level one
+        rng = random.Random(int(seed) if seed is not None else None)
         created = 0
-        now_local = datetime.now().astimezone()
+        now_local = dt_util.now()
+        # Stamped on every touched bucket; the simulated end times are in the past
+        now_iso = now_local.astimezone(timezone.utc).isoformat()
 
         def add_session(dt_local: datetime, duration: int, avg_flow: float, hot_pct: float):
             nonlocal created
             dt_utc = dt_local.astimezone(timezone.utc)
+            local = dt_util.as_local(dt_utc)
             occ_raw, occ_class, people_bin = self._classify_context(dt_utc)
+            ended_at = int(dt_utc.timestamp())
             rec = SessionRecord(
-                ended_at=dt_utc.isoformat(),
+                ended_at=ended_at,
                 volume=round((avg_flow / 60.0) * max(1, duration), 3),
                 duration_s=int(duration),
                 avg_flow=float(avg_flow),
@@ -540,67 +905,67 @@ class WaterMonitorEngine:
                 occ_raw=occ_raw,
                 occ_class=occ_class,
                 people_bin=people_bin,
+                day_key=_day_key_ts(ended_at),
+                local_hour=local.hour,
+                local_weekday=local.weekday(),
             )
-            self._state.sessions.append(rec)
+            self._append_session(rec)
             # Update stats
-            h, dty = self._local_hour_and_daytype(dt_utc)
-            self._update_hourly_stats(h, dty, rec.duration_s, rec.avg_flow)
-            self._update_context_stats(h, dty, occ_class, people_bin, rec.duration_s, rec.avg_flow)
+            h, dty = rec.local_hour, _DAY_TYPES[rec.local_weekday >= 5]
+            self._update_hourly_stats(h, dty, rec.duration_s, rec.avg_flow, now_iso)
+            self._update_context_stats(h, dty, occ_class, people_bin, rec.duration_s, rec.avg_flow, now_iso)
             created += 1
 
         for d in range(days, 0, -1):
             base_day = (now_local - timedelta(days=d)).replace(minute=0, second=0, microsecond=0)
             dow = base_day.weekday()
             # Morning showers (1-3)
-            for _ in range(random.randint(1, 3)):
-                hr = random.choice([6, 7, 8])
-                dur = random.randint(300, 600)  # 5-10 min
-                flow = random.uniform(1.5, 2.5)
-                hot = random.uniform(40.0, 80.0)
-                add_session(base_day.replace(hour=hr) + timedelta(minutes=random.randint(0, 50)), dur, flow, hot)
+            for _ in range(rng.randint(1, 3)):
+                hr = rng.choice([6, 7, 8])
+                dur = rng.randint(300, 600)  # 5-10 min
+                flow = rng.uniform(1.5, 2.5)
+                hot = rng.uniform(40.0, 80.0)
+                add_session(base_day.replace(hour=hr) + timedelta(minutes=rng.randint(0, 50)), dur, flow, hot)
             # Handwashing (3-10)
-            for _ in range(random.randint(3, 10)):
-                hr = random.randint(7, 22)
-                dur = random.randint(10, 40)
-                flow = random.uniform(0.2, 0.8)
-                hot = random.uniform(0.0, 40.0)
-                add_session(base_day.replace(hour=hr) + timedelta(minutes=random.randint(0, 59)), dur, flow, hot)
+            for _ in range(rng.randint(3, 10)):
+                hr = rng.randint(7, 22)
+                dur = rng.randint(10, 40)
+                flow = rng.uniform(0.2, 0.8)
+                hot = rng.uniform(0.0, 40.0)
+                add_session(base_day.replace(hour=hr) + timedelta(minutes=rng.randint(0, 59)), dur, flow, hot)
             # Toilets (6-14), more likely in morning and evening; realistic 2.5–4.0 gpm for ~15–40s
             # Optional reflush once after 30–120s with shorter duration
-            for _ in range(random.randint(6, 14)):
+            for _ in range(rng.randint(6, 14)):
                 # Weight morning/evening hours higher
                 hours = [6, 7, 8, 9, 17, 18, 19, 20, 21, 22, 10, 11, 12, 13, 14, 15, 16, 23]
                 weights = [8, 8, 8, 5, 8, 8, 8, 7, 6, 5, 3, 3, 3, 3, 3, 3, 3, 2]
-                hr = random.choices(hours, weights=weights, k=1)[0]
-                base_min = random.randint(0, 59)
-                dur = random.randint(15, 40)
-                flow = random.uniform(2.5, 4.0)
+                hr = rng.choices(hours, weights=weights, k=1)[0]
+                base_min = rng.randint(0, 59)
+                dur = rng.randint(15, 40)
+                flow = rng.uniform(2.5, 4.0)
                 hot = 0.0
                 start_dt = base_day.replace(hour=hr) + timedelta(minutes=base_min)
                 add_session(start_dt, dur, flow, hot)
                 # ~30% chance of a near-term second fill (reflush/top-off)
-                if random.random() < 0.30:
-                    re_dur = random.randint(10, 25)
-                    re_delay = random.randint(30, 120)
+                if rng.random() < 0.30:
+                    re_dur = rng.randint(10, 25)
+                    re_delay = rng.randint(30, 120)
                     add_session(start_dt + timedelta(seconds=re_delay), re_dur, flow, hot)
             # Dishwasher (0-1)
-            if random.random() < 0.6:
-                hr = random.choice([20, 21, 22])
-                dur = random.randint(1800, 3600)
-                flow = random.uniform(0.8, 1.4)
-                hot = random.uniform(30.0, 70.0)
-                add_session(base_day.replace(hour=hr) + timedelta(minutes=random.randint(0, 40)), dur, flow, hot)
+            if rng.random() < 0.6:
+                hr = rng.choice([20, 21, 22])
+                dur = rng.randint(1800, 3600)
+                flow = rng.uniform(0.8, 1.4)
+                hot = rng.uniform(30.0, 70.0)
+                add_session(base_day.replace(hour=hr) + timedelta(minutes=rng.randint(0, 40)), dur, flow, hot)
             # Irrigation (alternate days at ~5am)
             if include_irrigation and (dow % 2 == 0):
                 hr = 5
-                dur = random.randint(900, 1800)
-                flow = random.uniform(1.5, 3.0)
+                dur = rng.randint(900, 1800)
+                flow = rng.uniform(1.5, 3.0)
                 hot = 0.0
-                add_session(base_day.replace(hour=hr) + timedelta(minutes=random.randint(-10, 10)), dur, flow, hot)
+                add_session(base_day.replace(hour=hr) + timedelta(minutes=rng.randint(-10, 10)), dur, flow, hot)
 
-        # Bound session list size
-        if len(self._state.sessions) > 5000:
-            self._state.sessions = self._state.sessions[-5000:]
         await self._save()
         # Notify that data changed
         async_dispatcher_send(self.hass, engine_signal(self.entry_id), {
@@ -14,15 +14,55 @@ from .const import DOMAIN, CONF_SENSOR_PREFIX, CONF_SYNTHETIC_ENABLE
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
-    # Create expected baseline and leak sensitivity controls per entry
-    entities = [ExpectedBaselineNumber(entry), LeakSensitivityNumber(entry)]
     ex = {**entry.data, **entry.options}
+    prefix = ex.get(CONF_SENSOR_PREFIX) or entry.title or "Water Monitor"
+    # One device entry shared by every number on this config entry
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=prefix,
+        manufacturer="markaggar",
+        model="Water Session Tracking and Leak Detection",
+    )
+    # Create expected baseline and leak sensitivity controls per entry
+    entities = [ExpectedBaselineNumber(entry, prefix, device_info), LeakSensitivityNumber(entry, prefix, device_info)]
     if bool(ex.get(CONF_SYNTHETIC_ENABLE, False)):
-        entities.append(SyntheticFlowNumber(entry))
+        entities.append(SyntheticFlowNumber(entry, prefix, device_info))
     async_add_entities(entities)
 
 
-class ExpectedBaselineNumber(NumberEntity):
+class _WaterMonitorNumber(NumberEntity):
+    """Per-entry number control; subclasses set the suffixes, default and value rules."""
+
+    _unique_suffix: str
+    _name_suffix: str
+    _default: float = 0.0
+
+    def __init__(self, entry: ConfigEntry, prefix: str, device_info: DeviceInfo) -> None:
+        self._entry_id = entry.entry_id
+        self._attr_name = f"{prefix} {self._name_suffix}"
+        self._attr_unique_id = f"{entry.entry_id}_{self._unique_suffix}"
+        self._attr_device_info = device_info
+        self._attr_native_value = self._default
+
+    def _coerce(self, value: float) -> float:
+        try:
+            v = float(value)
+        except (TypeError, ValueError):
+            return self._default
+        return 0.0 if v < 0.0 else v
+
+    def _apply(self, v: float) -> None:
+        self._attr_native_value = v
+
+    async def async_set_native_value(self, value: float) -> None:
+        v = self._coerce(value)
+        if v == self._attr_native_value:
+            return  # unchanged; skip the state write
+        self._apply(v)
+        self.async_write_ha_state()
+
+
+class ExpectedBaselineNumber(_WaterMonitorNumber):
     """User-settable expected low-flow baseline (0 disables)."""
 
     _attr_native_step = 0.01
@@ -30,133 +70,50 @@ class ExpectedBaselineNumber(NumberEntity):
     _attr_native_min_value = 0.0
     _attr_native_max_value = 1000.0  # generous upper bound
     _attr_unit_of_measurement = None  # unit depends on upstream flow sensor; kept out to avoid mismatch
-
-    def __init__(self, entry: ConfigEntry) -> None:
-        self._entry = entry
-        ex = {**entry.data, **entry.options}
-        prefix = ex.get(CONF_SENSOR_PREFIX) or entry.title or "Water Monitor"
-        self._attr_name = f"{prefix} Expected low-flow baseline"
-        self._attr_unique_id = f"{entry.entry_id}_expected_baseline"
-        self._value: float = 0.0
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        ex = {**self._entry.data, **self._entry.options}
-        prefix = ex.get(CONF_SENSOR_PREFIX) or self._entry.title or "Water Monitor"
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=prefix,
-            manufacturer="markaggar",
-            model="Water Session Tracking and Leak Detection",
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        return float(self._value)
-
-    async def async_set_native_value(self, value: float) -> None:
-        self._value = max(0.0, float(value))
-        self.async_write_ha_state()
+    _unique_suffix = "expected_baseline"
+    _name_suffix = "Expected low-flow baseline"
 
 
-class LeakSensitivityNumber(NumberEntity):
+class LeakSensitivityNumber(_WaterMonitorNumber):
     """Controls how early the intelligent leak detector alerts (higher = earlier)."""
 
     _attr_mode = NumberMode.SLIDER
     _attr_native_min_value = 0.0
     _attr_native_max_value = 100.0
     _attr_native_step = 5.0
+    _unique_suffix = "leak_sensitivity"
+    _name_suffix = "Leak alert sensitivity"
+    _default = 50.0  # default midpoint
 
-    def __init__(self, entry: ConfigEntry) -> None:
-        self._entry = entry
-        ex = {**entry.data, **entry.options}
-        prefix = ex.get(CONF_SENSOR_PREFIX) or entry.title or "Water Monitor"
-        self._attr_name = f"{prefix} Leak alert sensitivity"
-        self._attr_unique_id = f"{entry.entry_id}_leak_sensitivity"
-        self._value: float = 50.0  # default midpoint
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        ex = {**self._entry.data, **self._entry.options}
-        prefix = ex.get(CONF_SENSOR_PREFIX) or self._entry.title or "Water Monitor"
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=prefix,
-            manufacturer="markaggar",
-            model="Water Session Tracking and Leak Detection",
-        )
-
-    @property
-    def native_value(self) -> float | None:
-        return float(self._value)
-
-    async def async_set_native_value(self, value: float) -> None:
-        try:
-            v = float(value)
-        except Exception:
-            v = 50.0
+    def _coerce(self, value: float) -> float:
         # Clamp and round to step to keep expectations stable
-        v = max(0.0, min(100.0, v))
+        v = super()._coerce(value)
+        v = 100.0 if v > 100.0 else v
         # snap to nearest step (5.0)
-        v = round(v / 5.0) * 5.0
-        self._value = v
-        self.async_write_ha_state()
+        return round(v / 5.0) * 5.0
 
 
-class SyntheticFlowNumber(NumberEntity):
+class SyntheticFlowNumber(_WaterMonitorNumber):
     """Integration-owned synthetic flow control (gpm)."""
 
     _attr_mode = NumberMode.BOX
     _attr_native_min_value = 0.0
     _attr_native_max_value = 50.0
     _attr_native_step = 0.01
-
-    def __init__(self, entry: ConfigEntry) -> None:
-        self._entry = entry
-        ex = {**entry.data, **entry.options}
-        prefix = ex.get(CONF_SENSOR_PREFIX) or entry.title or "Water Monitor"
-        self._attr_name = f"{prefix} Synthetic flow (gpm)"
-        self._attr_unique_id = f"{entry.entry_id}_synthetic_flow_gpm"
-        self._value: float = 0.0
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        ex = {**self._entry.data, **self._entry.options}
-        prefix = ex.get(CONF_SENSOR_PREFIX) or self._entry.title or "Water Monitor"
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=prefix,
-            manufacturer="markaggar",
-            model="Water Session Tracking and Leak Detection",
-        )
+    _unique_suffix = "synthetic_flow_gpm"
+    _name_suffix = "Synthetic flow (gpm)"
+    # Per-entry domain data, resolved once the entity is added
+    _edata: Optional[dict] = None
 
     async def async_added_to_hass(self) -> None:
+        self._edata = self.hass.data.setdefault(DOMAIN, {}).setdefault(self._entry_id, {})
         # Initialize from stored value if present
-        try:
-            domain_data = self.hass.data.get(DOMAIN, {}).get(self._entry.entry_id)
-            if isinstance(domain_data, dict):
-                v = domain_data.get("synthetic_flow_gpm")
-                if isinstance(v, (int, float)):
-                    self._value = max(0.0, float(v))
-        except Exception:
-            pass
-        self.async_write_ha_state()
+        v = self._edata.get("synthetic_flow_gpm")
+        if isinstance(v, (int, float)):
+            self._attr_native_value = max(0.0, float(v))
 
-    @property
-    def native_value(self) -> float | None:
-        return float(self._value)
-
-    async def async_set_native_value(self, value: float) -> None:
-        try:
-            v = max(0.0, float(value))
-        except Exception:
-            v = 0.0
-        self._value = v
+    def _apply(self, v: float) -> None:
+        super()._apply(v)
         # Persist in domain data for quick access by sensors/engine
-        try:
-            ddomain = self.hass.data.setdefault(DOMAIN, {})
-            edata = ddomain.setdefault(self._entry.entry_id, {})
-            edata["synthetic_flow_gpm"] = v
-        except Exception:
-            pass
-        self.async_write_ha_state()
+        if self._edata is not None:
+            self._edata["synthetic_flow_gpm"] = v
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import Any, Optional, Callable
 
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
@@ -11,10 +11,12 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_state_change_event,
     async_track_time_interval,
 )
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -42,6 +44,9 @@ from .engine import WaterMonitorEngine
 
 _LOGGER = logging.getLogger(__name__)
 
+# Hot water sensor states (lowercased) that count as hot water running
+_HOT_WATER_ON_STATES = frozenset(("on", "true", "1"))
+
 
 def _normalize_flow_unit(unit: str | None) -> str | None:
     """Normalize equivalent flow unit representations to canonical forms.
@@ -95,12 +100,20 @@ async def async_setup_entry(
     synthetic_master = bool(_get(CONF_SYNTHETIC_ENABLE, False))
     include_synth_in_detectors = bool(_get(CONF_INCLUDE_SYNTHETIC_IN_DETECTORS, False)) and synthetic_master
     sensor_prefix = _get(CONF_SENSOR_PREFIX, config_entry.title or "Water Monitor")
+    # One device entry shared by every sensor on this config entry
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, config_entry.entry_id)},
+        name=_get(CONF_SENSOR_PREFIX) or config_entry.title or "Water Monitor",
+        manufacturer="markaggar",
+        model="Water Session Tracking and Leak Detection",
+    )
     # Auto-enable integration-from-flow if no volume sensor configured
     calc_volume_from_flow = bool(_get(CONF_CALC_VOLUME_FROM_FLOW, False)) or (not volume_sensor)
     integration_method = str(_get(CONF_INTEGRATION_METHOD, INTEGRATION_METHOD_TRAPEZOIDAL))
 
     main_sensor = WaterSessionSensor(
         entry=config_entry,
+        device_info=device_info,
         flow_sensor=flow_sensor,
         volume_sensor=volume_sensor,
         hot_water_sensor=hot_water_sensor,
@@ -119,6 +132,7 @@ async def async_setup_entry(
 
     current_sensor = CurrentSessionVolumeSensor(
         entry=config_entry,
+        device_info=device_info,
         name=f"{sensor_prefix} Current session volume",
         unique_suffix="current_session",
     )
@@ -131,18 +145,21 @@ async def async_setup_entry(
     tracked = [e for e in [flow_sensor, (volume_sensor if not calc_volume_from_flow else None), hot_water_sensor] if e]
     duration_sensor = LastSessionDurationSensor(
         entry=config_entry,
+        device_info=device_info,
         name=f"{sensor_prefix} Last session duration",
         unique_suffix="last_session_duration",
         tracked_entities=tracked,
     )
     avg_flow_sensor = LastSessionAverageFlowSensor(
         entry=config_entry,
+        device_info=device_info,
         name=f"{sensor_prefix} Last session average flow",
         unique_suffix="last_session_avg_flow",
         tracked_entities=tracked,
     )
     hot_pct_sensor = LastSessionHotWaterPctSensor(
         entry=config_entry,
+        device_info=device_info,
         name=f"{sensor_prefix} Last session hot water percentage",
         unique_suffix="last_session_hot_pct",
         tracked_entities=tracked,
@@ -154,12 +171,13 @@ async def async_setup_entry(
     main_sensor.add_state_listener(hot_pct_sensor.update_from_tracker)
 
     # Also forward to engine for persistence/analysis
-    async def _forward_to_engine(state: dict):
+    @callback
+    def _forward_to_engine(state: dict):
         try:
             data = hass.data.get(DOMAIN, {}).get(config_entry.entry_id)
             engine: WaterMonitorEngine | None = data.get("engine") if data else None
             if engine:
-                await engine.ingest_state(state)
+                engine.ingest_state(state)
             # Broadcast live tracker state for other entities (e.g., intelligent leak)
             async_dispatcher_send(hass, tracker_signal(config_entry.entry_id), state)
         except Exception:
@@ -180,6 +198,7 @@ class WaterSessionSensor(SensorEntity):
     def __init__(
         self,
         entry: ConfigEntry,
+        device_info: DeviceInfo,
         flow_sensor: str,
         volume_sensor: str,
         hot_water_sensor: str,
@@ -197,6 +216,7 @@ class WaterSessionSensor(SensorEntity):
     ):
         """Initialize the sensor."""
         self._entry = entry
+        self._attr_device_info = device_info
         self._flow_sensor = flow_sensor
         self._volume_sensor = volume_sensor
         self._hot_water_sensor = hot_water_sensor
@@ -254,25 +274,14 @@ class WaterSessionSensor(SensorEntity):
         self._periodic_update_unsub = None
         self._periodic_interval_s = None  # seconds, or None
 
-        # Callbacks for dependent sensors (current session + metrics sensors)
-        self._listeners = []
+        # Callbacks for dependent sensors (current session + metrics sensors);
+        # a dict keeps registration order with O(1) duplicate checks
+        self._listeners: dict[Callable[[dict], None], None] = {}
         # Entities we may subscribe to for immediate updates
         self._synthetic_entity_id = None
 
         # Note: listeners are initialized per-instance in __init__
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Group both sensors under the integration device."""
-        ex = {**self._entry.data, **self._entry.options}
-        prefix = ex.get(CONF_SENSOR_PREFIX) or self._entry.title or "Water Monitor"
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=prefix,
-            manufacturer="markaggar",
-            model="Water Session Tracking and Leak Detection",
-        )
-
     @property
     def native_value(self):
         """Return the native value of the sensor."""
@@ -288,10 +297,13 @@ class WaterSessionSensor(SensorEntity):
         # Keep the method name for backward compatibility, but support multiple listeners internally.
         self.add_state_listener(callback)
 
-    def add_state_listener(self, callback: Callable[[dict], Any]):
-        """Register a listener to receive tracker state_data updates."""
-        if callback not in self._listeners:
-            self._listeners.append(callback)
+    def add_state_listener(self, callback: Callable[[dict], None]):
+        """Register a listener to receive tracker state_data updates.
+
+        Listeners are called synchronously from the update path, so they must be
+        @callback functions that only update attributes and write state.
+        """
+        self._listeners[callback] = None
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when entity is added to hass."""
@@ -341,11 +353,13 @@ class WaterSessionSensor(SensorEntity):
             )
 
         # Defer the initial update so other entities finish being added
-        self.hass.async_create_task(self._async_update_from_sensors())
+        self.hass.loop.call_soon(self._async_update_from_sensors)
 
-    async def _async_sensor_changed(self, event) -> None:
+    @callback
+    def _async_sensor_changed(self, event) -> None:
         """Handle sensor state changes."""
-        await self._async_update_from_sensors()
+        # The update never suspends, so run it inline rather than as a task
+        self._async_update_from_sensors()
 
     def _ensure_timer(self, interval_s: Optional[int], reason: str):
         """Ensure a periodic timer is running at the desired interval; cancel if None."""
@@ -373,16 +387,30 @@ class WaterSessionSensor(SensorEntity):
             self.hass, self._async_periodic_update, timedelta(seconds=self._periodic_interval_s)
         )
 
+    def _ensure_wakeup(self, delay_s: float, reason: str):
+        """Replace any periodic timer with a single update after delay_s seconds."""
+        if self._periodic_update_unsub is not None:
+            self._periodic_update_unsub()
+        self._periodic_interval_s = None
+        _LOGGER.debug("Next update in %.1fs: %s", delay_s, reason)
+        self._periodic_update_unsub = async_call_later(self.hass, max(0.05, delay_s), self._async_wakeup)
+
     def _cancel_periodic_updates(self, reason: str):
         self._ensure_timer(None, reason)
 
     @callback
-    async def _async_periodic_update(self, now: datetime) -> None:
+    def _async_wakeup(self, now: datetime) -> None:
+        """Handle a one-shot wake-up scheduled by _ensure_wakeup."""
+        self._periodic_update_unsub = None
+        self._async_update_from_sensors()
+
+    @callback
+    def _async_periodic_update(self, now: datetime) -> None:
         """Handle periodic updates for gap monitoring and session continuation."""
-        await self._async_update_from_sensors()
+        self._async_update_from_sensors()
 
-    def _apply_cadence(self, state_data: dict) -> None:
-        """Adaptive cadence: 5s during flow; 1s while gap at zero; none when idle."""
+    def _apply_cadence(self, state_data: dict, now: datetime) -> None:
+        """Adaptive cadence: 5s during flow; one wake-up at gap expiry while at zero; none when idle."""
         session_active = bool(state_data.get("current_session_active", False))
         gap_active = bool(state_data.get("gap_active", False))
         flow_used = float(state_data.get("flow_used_by_engine", 0.0))
@@ -390,19 +418,25 @@ class WaterSessionSensor(SensorEntity):
             # Predictable UI during active water usage
             self._ensure_timer(5, "active session timing")
         elif gap_active and flow_used == 0.0:
-            # Tight loop to promptly finalize gaps even while session remains active
-            self._ensure_timer(1, "gap monitoring at zero flow")
+            # Nothing changes during the gap until the tolerance expires and the session finalizes
+            deadline = self._tracker.gap_deadline
+            if deadline is not None:
+                self._ensure_wakeup((deadline - now).total_seconds(), "gap monitoring at zero flow")
+            else:
+                self._ensure_timer(1, "gap monitoring at zero flow")
         else:
             # Idle: cancel periodic updates (event-driven only)
             self._ensure_timer(None, "idle - event driven")
 
-    async def _async_update_from_sensors(self) -> None:
+    @callback
+    def _async_update_from_sensors(self) -> None:
         """Update the sensor from tracked entities."""
         try:
             # Get current sensor states
-            flow_state = self.hass.states.get(self._flow_sensor)
-            volume_state = self.hass.states.get(self._volume_sensor) if (self._volume_sensor and not self._calc_volume_from_flow) else None
-            hot_water_state = self.hass.states.get(self._hot_water_sensor) if self._hot_water_sensor else None
+            states_get = self.hass.states.get
+            flow_state = states_get(self._flow_sensor)
+            volume_state = states_get(self._volume_sensor) if (self._volume_sensor and not self._calc_volume_from_flow) else None
+            hot_water_state = states_get(self._hot_water_sensor) if self._hot_water_sensor else None
 
             # Check if required sensors are available and ready
             if self._calc_volume_from_flow:
@@ -426,12 +460,11 @@ class WaterSessionSensor(SensorEntity):
                 # Synthetic-only or unavailable flow sensor
                 flow_rate = 0.0
             volume_total = float(volume_state.state) if (volume_state and not self._calc_volume_from_flow) else 0.0
-            hot_water_active = False
-            if hot_water_state:
-                s = str(hot_water_state.state).lower()
-                hot_water_active = s in ("on", "true", "1")
+            hot_water_active = (
+                hot_water_state is not None and hot_water_state.state.lower() in _HOT_WATER_ON_STATES
+            )
 
-            current_time = datetime.now(timezone.utc)
+            current_time = dt_util.utcnow()
 
             # Determine unit from the volume sensor (if used), else infer from flow
             volume_unit = volume_state.attributes.get("unit_of_measurement") if volume_state else None
@@ -469,7 +502,7 @@ class WaterSessionSensor(SensorEntity):
             if self._sessions_use_baseline_as_zero:
                 baseline_val: float = 0.0
                 if self._baseline_entity_id:
-                    st = self.hass.states.get(self._baseline_entity_id)
+                    st = states_get(self._baseline_entity_id)
                     if st and st.state not in (None, "unknown", "unavailable"):
                         try:
                             baseline_val = max(0.0, float(st.state))
@@ -647,14 +680,14 @@ class WaterSessionSensor(SensorEntity):
             self._attr_available = True
 
             # Notify all listeners (dependent sensors)
-            for cb in list(self._listeners):
+            for cb in self._listeners:
                 try:
-                    await cb(state_data)
+                    cb(state_data)
                 except Exception as err:
                     _LOGGER.exception("Listener update failed: %s", err)
 
             # Apply adaptive cadence based on state and write state
-            self._apply_cadence(state_data)
+            self._apply_cadence(state_data, current_time)
             self.async_write_ha_state()
             self._prev_session_active = current_active
 
@@ -675,8 +708,9 @@ class CurrentSessionVolumeSensor(SensorEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 2  # show 2 decimals in UI
 
-    def __init__(self, entry: ConfigEntry, name: str, unique_suffix: str) -> None:
+    def __init__(self, entry: ConfigEntry, device_info: DeviceInfo, name: str, unique_suffix: str) -> None:
         self._entry = entry
+        self._attr_device_info = device_info
         self._attr_name = name
         self._attr_unique_id = f"{entry.entry_id}_{unique_suffix}"
         self._attr_native_value = 0.0
@@ -684,18 +718,6 @@ class CurrentSessionVolumeSensor(SensorEntity):
         self._attr_available = True
         self._attr_native_unit_of_measurement = None  # Set dynamically from volume sensor via main sensor
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Group both sensors under the integration device."""
-        ex = {**self._entry.data, **self._entry.options}
-        prefix = ex.get(CONF_SENSOR_PREFIX) or self._entry.title or "Water Monitor"
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=prefix,
-            manufacturer="markaggar",
-            model="Water Session Tracking and Leak Detection",
-        )
-
     @property
     def native_value(self):
         """Return the native value of the sensor."""
@@ -724,7 +746,8 @@ class CurrentSessionVolumeSensor(SensorEntity):
             return "current"
         return "final"
 
-    async def update_from_tracker(self, state_data: dict):
+    @callback
+    def update_from_tracker(self, state_data: dict):
         """Update this sensor when main sensor updates."""
         # Sync the unit from the main sensor (derived from source volume sensor)
         unit = state_data.get("volume_unit")
@@ -796,8 +819,9 @@ class _BaseDependentSensor(SensorEntity):
 
     _tracked_entities: list[str]
 
-    def __init__(self, entry: ConfigEntry, name: str, unique_suffix: str, tracked_entities: list[str]):
+    def __init__(self, entry: ConfigEntry, device_info: DeviceInfo, name: str, unique_suffix: str, tracked_entities: list[str]):
         self._entry = entry
+        self._attr_device_info = device_info
         self._attr_name = name
         self._attr_unique_id = f"{entry.entry_id}_{unique_suffix}"
         self._attr_available = True
@@ -805,17 +829,6 @@ class _BaseDependentSensor(SensorEntity):
         # Track upstream to manage availability
         self._tracked_entities = [e for e in tracked_entities if e]
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        ex = {**self._entry.data, **self._entry.options}
-        prefix = ex.get(CONF_SENSOR_PREFIX) or self._entry.title or "Water Monitor"
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=prefix,
-            manufacturer="markaggar",
-            model="Water Session Tracking and Leak Detection",
-        )
-
     def _upstream_available(self) -> bool:
         if not self._tracked_entities:
             return True
@@ -847,33 +860,46 @@ class _BaseDependentSensor(SensorEntity):
             self._attr_available = now
             self.async_write_ha_state()
 
+    @staticmethod
+    def _tracker_attributes(state_data: dict) -> dict[str, Any]:
+        """Debug/transparency attributes shared by every last-session sensor."""
+        return {
+            "debug_state": state_data.get("debug_state"),
+            "integration_method": state_data.get("integration_method"),
+            "sampling_active_seconds": state_data.get("sampling_active_seconds"),
+            "sampling_gap_seconds": state_data.get("sampling_gap_seconds"),
+        }
 
-class LastSessionDurationSensor(_BaseDependentSensor):
-    """Reports the duration (s) of the last completed session."""
 
-    _attr_icon = "mdi:timer"
-    _attr_state_class = SensorStateClass.MEASUREMENT
+class _LastSessionMetricSensor(_BaseDependentSensor):
+    """Reports one last-session field of the tracker state, cast and optionally rounded."""
 
-    def __init__(self, entry: ConfigEntry, name: str, unique_suffix: str, tracked_entities: list[str]):
-        super().__init__(entry, name, unique_suffix, tracked_entities)
-        self._attr_native_unit_of_measurement = "s"
-        self._attr_native_value = 0
+    _state_key: str
+    _cast: Callable[[Any], Any] = float
+    _digits: Optional[int] = None
 
-    async def update_from_tracker(self, state_data: dict):
+    @callback
+    def update_from_tracker(self, state_data: dict):
         # Only mark available True if upstream is available
         self._attr_available = self._upstream_available()
-        val = int(state_data.get("last_session_duration", 0) or 0)
-        self._attr_native_value = val
-        self._attr_extra_state_attributes = {
-            "debug_state": state_data.get("debug_state"),
-            "integration_method": state_data.get("integration_method"),
-            "sampling_active_seconds": state_data.get("sampling_active_seconds"),
-            "sampling_gap_seconds": state_data.get("sampling_gap_seconds"),
-        }
+        val = self._cast(state_data.get(self._state_key, 0) or 0)
+        self._attr_native_value = val if self._digits is None else round(val, self._digits)
+        self._attr_extra_state_attributes = self._tracker_attributes(state_data)
         if self.hass is not None:
             self.async_write_ha_state()
 
 
+class LastSessionDurationSensor(_LastSessionMetricSensor):
+    """Reports the duration (s) of the last completed session."""
+
+    _attr_icon = "mdi:timer"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = "s"
+    _attr_native_value = 0
+    _state_key = "last_session_duration"
+    _cast = int
+
+
 class LastSessionAverageFlowSensor(_BaseDependentSensor):
     """Reports average flow of the last session (volume unit per minute)."""
 
@@ -881,12 +907,13 @@ class LastSessionAverageFlowSensor(_BaseDependentSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 2
 
-    def __init__(self, entry: ConfigEntry, name: str, unique_suffix: str, tracked_entities: list[str]):
-        super().__init__(entry, name, unique_suffix, tracked_entities)
+    def __init__(self, entry: ConfigEntry, device_info: DeviceInfo, name: str, unique_suffix: str, tracked_entities: list[str]):
+        super().__init__(entry, device_info, name, unique_suffix, tracked_entities)
         self._attr_native_unit_of_measurement = None  # set from volume unit
         self._attr_native_value = 0.0
 
-    async def update_from_tracker(self, state_data: dict):
+    @callback
+    def update_from_tracker(self, state_data: dict):
         self._attr_available = self._upstream_available()
         vol_unit = state_data.get("volume_unit")
         flow_unit = state_data.get("flow_unit")
@@ -956,36 +983,19 @@ class LastSessionAverageFlowSensor(_BaseDependentSensor):
         self._attr_extra_state_attributes = {
             "volume_unit": vol_unit,
             "flow_unit": flow_unit,
-            "debug_state": state_data.get("debug_state"),
-            "integration_method": state_data.get("integration_method"),
-            "sampling_active_seconds": state_data.get("sampling_active_seconds"),
-            "sampling_gap_seconds": state_data.get("sampling_gap_seconds"),
+            **self._tracker_attributes(state_data),
         }
         if self.hass is not None:
             self.async_write_ha_state()
 
 
-class LastSessionHotWaterPctSensor(_BaseDependentSensor):
+class LastSessionHotWaterPctSensor(_LastSessionMetricSensor):
     """Reports hot water percentage of the last session."""
 
     _attr_icon = "mdi:fire"
     _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(self, entry: ConfigEntry, name: str, unique_suffix: str, tracked_entities: list[str]):
-        super().__init__(entry, name, unique_suffix, tracked_entities)
-        self._attr_native_unit_of_measurement = "%"
-        self._attr_native_value = 0.0
-
-    async def update_from_tracker(self, state_data: dict):
-        self._attr_available = self._upstream_available()
-        val = float(state_data.get("last_session_hot_water_pct", 0.0) or 0.0)
-        # Tracker rounds to 0.1; keep one decimal
-        self._attr_native_value = round(val, 1)
-        self._attr_extra_state_attributes = {
-            "debug_state": state_data.get("debug_state"),
-            "integration_method": state_data.get("integration_method"),
-            "sampling_active_seconds": state_data.get("sampling_active_seconds"),
-            "sampling_gap_seconds": state_data.get("sampling_gap_seconds"),
-        }
-        if self.hass is not None:
-            self.async_write_ha_state()
\ No newline at end of file
+    _attr_native_unit_of_measurement = "%"
+    _attr_native_value = 0.0
+    _state_key = "last_session_hot_water_pct"
+    # Tracker rounds to 0.1; keep one decimal
+    _digits = 1
@@ -1,6 +1,6 @@
 """Water session tracking logic - with accurate hot water accumulation and derived metrics."""
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
@@ -99,6 +99,13 @@ class WaterSessionTracker:
 
         self._last_update_ts = timestamp
 
+    @property
+    def gap_deadline(self) -> Optional[datetime]:
+        """When the open gap finalizes the session if flow stays at zero, else None."""
+        if not (self._session_active and self._gap_active) or self._session_end_candidate_time is None:
+            return None
+        return self._session_end_candidate_time + timedelta(seconds=self.session_gap_tolerance)
+
     def update(
         self, 
         flow_rate: float, 